@@ -6,17 +6,20 @@ which contains 27 colors from thesis color PDFs combined with Oxford branding co
 """
 
 import sys
-sys.path.insert(0, 'oxford_matplotlib_theme')
-from colors import OxfordColors, get_palette, ColorPalettes
 
-print("=" * 70)
-print("PHC-THESIS PALETTE DEMONSTRATION")
-print("=" * 70)
-print()
+from oxford_matplotlib_theme.colors import OxfordColors, get_palette, ColorPalettes
+
+# Output is collected and written to stdout in one go at the end
+lines = []
+
+lines.append("=" * 70)
+lines.append("PHC-THESIS PALETTE DEMONSTRATION")
+lines.append("=" * 70)
+lines.append("")
 
 # Display new thesis colors
-print("NEW THESIS COLORS ADDED:")
-print("-" * 70)
+lines.append("NEW THESIS COLORS ADDED:")
+lines.append("-" * 70)
 thesis_colors = [
     'WHITE', 'BLACK', 'THESIS_PURPLE_1', 'BRIGHT_BLUE',
     'THESIS_PURPLE_2', 'SLATE_BLUE_1', 'SLATE_BLUE_2',
@@ -26,91 +29,88 @@ thesis_colors = [
     'PALE_GREY', 'HEATHER', 'CORNFLOWER'
 ]
 
+color_attrs = vars(OxfordColors)
 for i, color_name in enumerate(thesis_colors, 1):
-    color_value = getattr(OxfordColors, color_name)
-    print(f"{i:2d}. {color_name:20s} = {color_value}")
+    lines.append(f"{i:2d}. {color_name:20s} = {color_attrs[color_name]}")
 
-print()
-print("=" * 70)
-print("PHC-THESIS PALETTE (27 colors)")
-print("=" * 70)
-print()
+lines.append("")
+lines.append("=" * 70)
+lines.append("PHC-THESIS PALETTE (27 colors)")
+lines.append("=" * 70)
+lines.append("")
 
 # Get the PHC-THESIS palette
 phc_palette = get_palette('phc_thesis')
 
-print(f"Total colors in PHC-THESIS palette: {len(phc_palette)}")
-print()
+lines.append(f"Total colors in PHC-THESIS palette: {len(phc_palette)}")
+lines.append("")
 
 # Display palette organization
-print("PALETTE ORGANIZATION:")
-print("-" * 70)
-print("Oxford Branding (2):")
-print(f"  1. OXFORD_BLUE  = {phc_palette[0]}")
-print(f"  2. OXFORD_PHC   = {phc_palette[1]}")
-print()
-
-print("Blues (9):")
-for i in range(2, 10):
-    print(f"  {i+1}. {phc_palette[i]}")
-print()
-
-print("Purples (10):")
-for i in range(10, 20):
-    print(f"  {i+1}. {phc_palette[i]}")
-print()
-
-print("Neutrals & Accents (6):")
-for i in range(20, 27):
-    print(f"  {i+1}. {phc_palette[i]}")
-print()
-
-print("=" * 70)
-print("USAGE EXAMPLES")
-print("=" * 70)
-print()
-
-print("Example 1: Get all 27 colors")
-print("-" * 70)
-print("```python")
-print("from oxford_matplotlib_theme import get_palette")
-print()
-print("colors = get_palette('phc_thesis')")
-print("print(len(colors))  # 27")
-print("```")
-print()
-
-print("Example 2: Use specific thesis colors")
-print("-" * 70)
-print("```python")
-print("from oxford_matplotlib_theme import OxfordColors")
-print()
-print("plt.plot(x, y, color=OxfordColors.BRIGHT_BLUE)")
-print("plt.scatter(x, z, color=OxfordColors.THESIS_PURPLE_1)")
-print("```")
-print()
-
-print("Example 3: Cycle through palette for many series")
-print("-" * 70)
-print("```python")
-print("colors = get_palette('phc_thesis', n_colors=40)  # Cycles after 27")
-print("for i, color in enumerate(colors):")
-print("    ax.plot(x, data[i], color=color, label=f'Series {i+1}')")
-print("```")
-print()
-
-print("=" * 70)
-print("SUMMARY")
-print("=" * 70)
-print(f"- Added 21 new thesis color constants")
-print(f"- Total colors now: 57 (36 original + 21 new)")
-print(f"- Created PHC_THESIS palette with 27 colors")
-print(f"- Total palettes now: 13")
-print(f"- Updated all tests and documentation")
-print()
-print("The PHC-THESIS palette is ideal for:")
-print("  • PhD theses and dissertations")
-print("  • Extended academic documents")
-print("  • Multi-chapter publications")
-print("  • Large datasets requiring many distinct colors")
-print("=" * 70)
+lines.append("PALETTE ORGANIZATION:")
+lines.append("-" * 70)
+lines.append("Oxford Branding (2):")
+lines.append(f"  1. OXFORD_BLUE  = {phc_palette[0]}")
+lines.append(f"  2. OXFORD_PHC   = {phc_palette[1]}")
+lines.append("")
+
+for section, start, stop in [
+    ("Blues (9)", 2, 10),
+    ("Purples (10)", 10, 20),
+    ("Neutrals & Accents (6)", 20, 27),
+]:
+    entries = "\n".join(
+        f"  {i}. {color}" for i, color in enumerate(phc_palette[start:stop], start=start + 1)
+    )
+    lines.append(f"{section}:\n{entries}\n")
+
+lines.append("=" * 70)
+lines.append("USAGE EXAMPLES")
+lines.append("=" * 70)
+lines.append("")
+
+lines.append("Example 1: Get all 27 colors")
+lines.append("-" * 70)
+lines.append("```python")
+lines.append("from oxford_matplotlib_theme import get_palette")
+lines.append("")
+lines.append("colors = get_palette('phc_thesis')")
+lines.append("print(len(colors))  # 27")
+lines.append("```")
+lines.append("")
+
+lines.append("Example 2: Use specific thesis colors")
+lines.append("-" * 70)
+lines.append("```python")
+lines.append("from oxford_matplotlib_theme import OxfordColors")
+lines.append("")
+lines.append("plt.plot(x, y, color=OxfordColors.BRIGHT_BLUE)")
+lines.append("plt.scatter(x, z, color=OxfordColors.THESIS_PURPLE_1)")
+lines.append("```")
+lines.append("")
+
+lines.append("Example 3: Cycle through palette for many series")
+lines.append("-" * 70)
+lines.append("```python")
+lines.append("colors = get_palette('phc_thesis', n_colors=40)  # Cycles after 27")
+lines.append("for i, color in enumerate(colors):")
+lines.append("    ax.plot(x, data[i], color=color, label=f'Series {i+1}')")
+lines.append("```")
+lines.append("")
+
+lines.append("=" * 70)
+lines.append("SUMMARY")
+lines.append("=" * 70)
+lines.append(f"- Added 21 new thesis color constants")
+lines.append(f"- Total colors now: 57 (36 original + 21 new)")
+lines.append(f"- Created PHC_THESIS palette with 27 colors")
+lines.append(f"- Total palettes now: 13")
+lines.append(f"- Updated all tests and documentation")
+lines.append("")
+lines.append("The PHC-THESIS palette is ideal for:")
+lines.append("  • PhD theses and dissertations")
+lines.append("  • Extended academic documents")
+lines.append("  • Multi-chapter publications")
+lines.append("  • Large datasets requiring many distinct colors")
+lines.append("=" * 70)
+
+sys.stdout.write("\n".join(lines) + "\n")
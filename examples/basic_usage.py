@@ -4,29 +4,41 @@ Oxford Matplotlib Theme - Basic Usage Examples
 Demonstrates basic plotting with Oxford University styling.
 
 Run this script to see 6 fundamental plot types with Oxford branding.
+
+With OMT_HEADLESS=1 (or the --save flag) figures are rendered with the Agg
+backend and saved as PNGs. For other batch use, set MPLBACKEND=Agg.
 """
 
+import os
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
-from oxford_matplotlib_theme import apply_oxford_theme, get_palette
+from oxford_matplotlib_theme import get_palette
 
 
-# Apply Oxford theme globally
-apply_oxford_theme()
+# matplotlib.pyplot is imported lazily so importing this module stays cheap.
+def _get_axes(ax, figsize):
+    """Return ``(fig, ax)``, creating a standalone figure when ``ax`` is None."""
+    if ax is None:
+        import matplotlib.pyplot as plt
+        return plt.subplots(figsize=figsize)
+    return ax.figure, ax
 
 
-def example_1_line_plot():
+def example_1_line_plot(ax=None):
     """Example 1: Line plot with multiple series."""
     print("Creating Example 1: Line plot with multiple series...")
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    standalone = ax is None
+    fig, ax = _get_axes(ax, figsize=(10, 6))
 
     # Generate data
     x = np.linspace(0, 10, 100)
     y1 = np.sin(x)
     y2 = np.cos(x)
-    y3 = np.sin(x) * np.exp(-x/10)
-    y4 = np.cos(x) * np.exp(-x/10)
+    decay = np.exp(-0.1 * x)
+    y3 = y1 * decay
+    y4 = y2 * decay
 
     # Plot multiple series (will use Oxford color cycle)
     ax.plot(x, y1, label='sin(x)', linewidth=2)
@@ -41,31 +53,36 @@ def example_1_line_plot():
     ax.legend(loc='upper right')
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
+    if standalone:
+        fig.tight_layout()
     return fig
 
 
-def example_2_bar_chart():
+def example_2_bar_chart(ax=None):
     """Example 2: Bar chart with grouped bars."""
     print("Creating Example 2: Grouped bar chart...")
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    standalone = ax is None
+    fig, ax = _get_axes(ax, figsize=(10, 6))
 
-    # Data
+    # Data (one row per group)
     categories = ['Category A', 'Category B', 'Category C', 'Category D']
-    group1 = [23, 45, 56, 78]
-    group2 = [35, 52, 48, 65]
-    group3 = [42, 38, 61, 55]
-
-    # Bar positions
+    groups = np.array([
+        [23, 45, 56, 78],
+        [35, 52, 48, 65],
+        [42, 38, 61, 55],
+    ])
+    group_labels = ['Group 1', 'Group 2', 'Group 3']
+
+    # Bar positions for every group at once
     x = np.arange(len(categories))
     width = 0.25
+    positions = x + np.array([-width, 0, width])[:, np.newaxis]
 
     # Create bars with Oxford colors
     colors = get_palette('primary', n_colors=3)
-    ax.bar(x - width, group1, width, label='Group 1', color=colors[0])
-    ax.bar(x, group2, width, label='Group 2', color=colors[1])
-    ax.bar(x + width, group3, width, label='Group 3', color=colors[2])
+    for pos, values, label, color in zip(positions, groups, group_labels, colors):
+        ax.bar(pos, values, width, label=label, color=color)
 
     # Styling
     ax.set_xlabel('Categories')
@@ -76,39 +93,30 @@ def example_2_bar_chart():
     ax.legend()
     ax.grid(True, axis='y', alpha=0.3)
 
-    plt.tight_layout()
+    if standalone:
+        fig.tight_layout()
     return fig
 
 
-def example_3_scatter_plot():
+def example_3_scatter_plot(ax=None):
     """Example 3: Scatter plot with color-coded groups."""
     print("Creating Example 3: Scatter plot with groups...")
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    standalone = ax is None
+    fig, ax = _get_axes(ax, figsize=(10, 6))
 
-    # Generate random data for three groups
-    np.random.seed(42)
+    # Generate random data for three groups in one draw: (group, x/y, point)
+    rng = np.random.default_rng(42)
     n_points = 50
-
-    # Group 1
-    x1 = np.random.normal(2, 0.8, n_points)
-    y1 = np.random.normal(2, 0.8, n_points)
-
-    # Group 2
-    x2 = np.random.normal(5, 0.8, n_points)
-    y2 = np.random.normal(5, 0.8, n_points)
-
-    # Group 3
-    x3 = np.random.normal(8, 0.8, n_points)
-    y3 = np.random.normal(3, 0.8, n_points)
+    centers = np.array([[2, 2], [5, 5], [8, 3]])
+    points = rng.normal(0, 0.8, (len(centers), 2, n_points)) + centers[:, :, np.newaxis]
 
     # Get colors from Oxford palette
     colors = get_palette('vibrant', n_colors=3)
 
-    # Plot with different markers
-    ax.scatter(x1, y1, s=100, alpha=0.6, color=colors[0], label='Group A', edgecolors='white', linewidth=0.5)
-    ax.scatter(x2, y2, s=100, alpha=0.6, color=colors[1], label='Group B', edgecolors='white', linewidth=0.5)
-    ax.scatter(x3, y3, s=100, alpha=0.6, color=colors[2], label='Group C', edgecolors='white', linewidth=0.5)
+    # Plot each group with its own color
+    for (x, y), color, label in zip(points, colors, ['Group A', 'Group B', 'Group C']):
+        ax.scatter(x, y, s=100, alpha=0.6, color=color, label=label, edgecolors='white', linewidth=0.5)
 
     # Styling
     ax.set_xlabel('Feature X')
@@ -117,23 +125,27 @@ def example_3_scatter_plot():
     ax.legend()
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
+    if standalone:
+        fig.tight_layout()
     return fig
 
 
-def example_4_histogram():
+def example_4_histogram(ax=None):
     """Example 4: Histogram with distribution."""
     print("Creating Example 4: Histogram...")
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    standalone = ax is None
+    fig, ax = _get_axes(ax, figsize=(10, 6))
 
     # Generate random data
-    np.random.seed(42)
-    data = np.random.normal(100, 15, 1000)
+    rng = np.random.default_rng(42)
+    data = rng.normal(100, 15, 1000)
 
     # Create histogram with Oxford color
     colors = get_palette('primary')
-    ax.hist(data, bins=30, color=colors[0], alpha=0.7, edgecolor='white', linewidth=0.5)
+    counts, edges = np.histogram(data, bins=30, range=(data.min(), data.max()))
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+           color=colors[0], alpha=0.7, edgecolor='white', linewidth=0.5)
 
     # Add mean line
     mean_value = np.mean(data)
@@ -146,15 +158,17 @@ def example_4_histogram():
     ax.legend()
     ax.grid(True, axis='y', alpha=0.3)
 
-    plt.tight_layout()
+    if standalone:
+        fig.tight_layout()
     return fig
 
 
-def example_5_pie_chart():
+def example_5_pie_chart(ax=None):
     """Example 5: Pie chart with Oxford colors."""
     print("Creating Example 5: Pie chart...")
 
-    fig, ax = plt.subplots(figsize=(10, 8))
+    standalone = ax is None
+    fig, ax = _get_axes(ax, figsize=(10, 8))
 
     # Data
     sizes = [30, 25, 20, 15, 10]
@@ -184,24 +198,21 @@ def example_5_pie_chart():
 
     ax.set_title('Distribution by Category')
 
-    plt.tight_layout()
+    if standalone:
+        fig.tight_layout()
     return fig
 
 
-def example_6_box_plot():
+def example_6_box_plot(ax=None):
     """Example 6: Box plot comparing distributions."""
     print("Creating Example 6: Box plot...")
 
-    fig, ax = plt.subplots(figsize=(10, 6))
-
-    # Generate data for different groups
-    np.random.seed(42)
-    data1 = np.random.normal(100, 10, 100)
-    data2 = np.random.normal(110, 15, 100)
-    data3 = np.random.normal(95, 8, 100)
-    data4 = np.random.normal(105, 12, 100)
+    standalone = ax is None
+    fig, ax = _get_axes(ax, figsize=(10, 6))
 
-    data = [data1, data2, data3, data4]
+    # Generate data for different groups in one draw: one column per group
+    rng = np.random.default_rng(42)
+    data = rng.normal([100, 110, 95, 105], [10, 15, 8, 12], (100, 4))
     labels = ['Treatment A', 'Treatment B', 'Treatment C', 'Treatment D']
 
     # Create box plot
@@ -211,8 +222,7 @@ def example_6_box_plot():
 
     # Color the boxes
     for patch, color in zip(bp['boxes'], colors):
-        patch.set_facecolor(color)
-        patch.set_alpha(0.7)
+        patch.set(facecolor=color, alpha=0.7)
 
     # Style whiskers, caps, and medians
     for whisker in bp['whiskers']:
@@ -229,36 +239,71 @@ def example_6_box_plot():
     ax.set_title('Comparison of Treatment Effects')
     ax.grid(True, axis='y', alpha=0.3)
 
-    plt.tight_layout()
+    if standalone:
+        fig.tight_layout()
     return fig
 
 
-def main():
-    """Run all examples and display them."""
+def main(combined=False):
+    """
+    Run all examples and display them.
+
+    With ``combined=True`` the examples share a single 2x3 figure grid.
+    """
+    # Render off-screen with Agg and save PNGs instead of opening windows when
+    # OMT_HEADLESS is 1/true/yes or --save is passed (CI, batch jobs).
+    # An explicit MPLBACKEND is respected.
+    headless = (
+        os.environ.get('OMT_HEADLESS', '').lower() in {'1', 'true', 'yes'}
+        or '--save' in sys.argv[1:]
+    )
+    if headless and 'MPLBACKEND' not in os.environ:
+        import matplotlib
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from oxford_matplotlib_theme import apply_oxford_theme
+
+    # Apply Oxford theme globally
+    apply_oxford_theme()
+
     print("=" * 70)
     print("Oxford Matplotlib Theme - Basic Usage Examples")
     print("=" * 70)
     print()
 
     # Create all examples
-    examples = [
-        example_1_line_plot(),
-        example_2_bar_chart(),
-        example_3_scatter_plot(),
-        example_4_histogram(),
-        example_5_pie_chart(),
-        example_6_box_plot(),
+    example_funcs = [
+        example_1_line_plot,
+        example_2_bar_chart,
+        example_3_scatter_plot,
+        example_4_histogram,
+        example_5_pie_chart,
+        example_6_box_plot,
     ]
+    if combined:
+        # Draw every example into one figure grid instead of one figure each
+        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+        for func, ax in zip(example_funcs, axes.flat):
+            func(ax=ax)
+        fig.tight_layout()
+        figures = [fig]
+    else:
+        figures = [func() for func in example_funcs]
 
     print()
     print("=" * 70)
-    print(f"Created {len(examples)} example figures")
-    print("Close the figure windows to exit")
+    print(f"Created {len(example_funcs)} examples in {len(figures)} figure(s)")
     print("=" * 70)
 
+    if headless:
+        for i, fig in enumerate(figures, 1):
+            fig.savefig(f'basic_usage_example_{i}.png', dpi=100)
+        return
+
     # Show all figures
+    print("Close the figure windows to exit")
     plt.show()
 
 
 if __name__ == '__main__':
-    main()
+    main(combined='--combined' in sys.argv[1:])
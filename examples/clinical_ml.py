@@ -7,45 +7,73 @@ These examples are particularly relevant for healthcare research and
 CPRD data analysis at the University of Oxford.
 
 Requirements: scikit-learn, scipy, pandas
+
+With OMT_HEADLESS=1 (or the --save flag) figures are rendered with the Agg
+backend and saved as PNGs. For other batch use, set MPLBACKEND=Agg.
 """
 
+import importlib.util
+import os
+import sys
+from functools import lru_cache
+
 import numpy as np
-import matplotlib.pyplot as plt
-from oxford_matplotlib_theme import apply_oxford_theme, get_palette
+from oxford_matplotlib_theme import get_palette
+
+# np.trapz was renamed to np.trapezoid in NumPy 2.0
+_trapezoid = getattr(np, 'trapezoid', None) or np.trapz
+
+
+# matplotlib and scikit-learn are imported inside the example functions so that
+# importing this module (e.g. for generate_sample_predictions) stays cheap.
+@lru_cache(maxsize=None)
+def _sklearn_available():
+    """Check whether scikit-learn is installed without importing it."""
+    return importlib.util.find_spec('sklearn') is not None
 
-# Apply Oxford theme
-apply_oxford_theme()
 
-# Check for optional dependencies
-try:
-    from sklearn.metrics import roc_curve, auc, precision_recall_curve
-    from sklearn.calibration import calibration_curve
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    print("Warning: scikit-learn not available. Some examples will use simulated metrics.")
-    SKLEARN_AVAILABLE = False
+@lru_cache(maxsize=32)
+def _get_cmap(name):
+    """Resolve a colormap by name once and reuse the Colormap object."""
+    import matplotlib.pyplot as plt
+    return plt.get_cmap(name)
+
+
+def _get_axes(ax, figsize):
+    """Return ``(fig, ax)``, creating a standalone figure when ``ax`` is None."""
+    if ax is None:
+        import matplotlib.pyplot as plt
+        return plt.subplots(figsize=figsize)
+    return ax.figure, ax
 
 
 def generate_sample_predictions(n_samples=1000, seed=42):
     """Generate sample prediction data for demonstration."""
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     # True labels
-    y_true = np.random.binomial(1, 0.3, n_samples)
+    y_true = rng.binomial(1, 0.3, n_samples)
+    positive = y_true.astype(bool)
+    n_positive = int(positive.sum())
 
-    # Predictions from different models (with varying performance)
-    model1_pred = y_true * np.random.beta(8, 2, n_samples) + (1 - y_true) * np.random.beta(2, 8, n_samples)
-    model2_pred = y_true * np.random.beta(7, 3, n_samples) + (1 - y_true) * np.random.beta(3, 7, n_samples)
-    model3_pred = y_true * np.random.beta(6, 4, n_samples) + (1 - y_true) * np.random.beta(4, 6, n_samples)
+    # Predictions from different models (with varying performance):
+    # positives and negatives are drawn from mirrored beta distributions
+    predictions = []
+    for a, b in [(8, 2), (7, 3), (6, 4)]:
+        pred = np.empty(n_samples)
+        pred[positive] = rng.beta(a, b, n_positive)
+        pred[~positive] = rng.beta(b, a, n_samples - n_positive)
+        predictions.append(pred)
 
-    return y_true, [model1_pred, model2_pred, model3_pred]
+    return y_true, predictions
 
 
-def example_1_roc_curve():
+def example_1_roc_curve(ax=None):
     """Example 1: ROC curves for multiple models."""
     print("Creating Example 1: ROC curves...")
 
-    fig, ax = plt.subplots(figsize=(10, 8))
+    standalone = ax is None
+    fig, ax = _get_axes(ax, figsize=(10, 8))
 
     # Generate sample data
     y_true, predictions = generate_sample_predictions()
@@ -54,11 +82,14 @@ def example_1_roc_curve():
     # Get colors
     colors = get_palette('primary', n_colors=3)
 
-    if SKLEARN_AVAILABLE:
+    if _sklearn_available():
+        from sklearn.metrics import roc_curve
+
         # Plot ROC curve for each model
         for pred, name, color in zip(predictions, model_names, colors):
             fpr, tpr, _ = roc_curve(y_true, pred)
-            roc_auc = auc(fpr, tpr)
+            # roc_curve returns fpr sorted ascending, so integrate directly
+            roc_auc = _trapezoid(tpr, fpr)
 
             ax.plot(fpr, tpr, color=color, linewidth=2.5,
                    label=f'{name} (AUC = {roc_auc:.3f})')
@@ -83,15 +114,17 @@ def example_1_roc_curve():
     ax.set_xlim([-0.02, 1.02])
     ax.set_ylim([-0.02, 1.02])
 
-    plt.tight_layout()
+    if standalone:
+        fig.tight_layout()
     return fig
 
 
-def example_2_precision_recall():
+def example_2_precision_recall(ax=None):
     """Example 2: Precision-Recall curves."""
     print("Creating Example 2: Precision-Recall curves...")
 
-    fig, ax = plt.subplots(figsize=(10, 8))
+    standalone = ax is None
+    fig, ax = _get_axes(ax, figsize=(10, 8))
 
     # Generate sample data
     y_true, predictions = generate_sample_predictions()
@@ -100,21 +133,20 @@ def example_2_precision_recall():
     # Get colors
     colors = get_palette('vibrant', n_colors=3)
 
-    if SKLEARN_AVAILABLE:
+    if _sklearn_available():
+        from sklearn.metrics import precision_recall_curve
+
         # Calculate baseline (prevalence)
         prevalence = np.mean(y_true)
 
         # Plot PR curve for each model
         for pred, name, color in zip(predictions, model_names, colors):
             precision, recall, _ = precision_recall_curve(y_true, pred)
-            pr_auc = auc(recall, precision)
+            # Recall is returned in decreasing order, hence the sign flip
+            pr_auc = -_trapezoid(precision, recall)
 
             ax.plot(recall, precision, color=color, linewidth=2.5,
                    label=f'{name} (AUC = {pr_auc:.3f})')
-
-        # Plot baseline
-        ax.axhline(y=prevalence, color='k', linestyle='--', linewidth=1.5,
-                   alpha=0.5, label=f'Baseline (prevalence = {prevalence:.3f})')
     else:
         # Simulated PR curves
         recall = np.linspace(0, 1, 100)
@@ -124,8 +156,11 @@ def example_2_precision_recall():
             ax.plot(recall, precision, color=color, linewidth=2.5,
                    label=f'{name} (AUC = {pr_auc:.3f})')
 
-        ax.axhline(y=0.3, color='k', linestyle='--', linewidth=1.5, alpha=0.5,
-                   label='Baseline (prevalence = 0.300)')
+        prevalence = 0.3
+
+    # Plot baseline across the bounded recall range
+    ax.plot([0, 1], [prevalence, prevalence], color='k', linestyle='--', linewidth=1.5,
+            alpha=0.5, label=f'Baseline (prevalence = {prevalence:.3f})')
 
     # Styling
     ax.set_xlabel('Recall (Sensitivity)', fontsize=12)
@@ -136,15 +171,17 @@ def example_2_precision_recall():
     ax.set_xlim([-0.02, 1.02])
     ax.set_ylim([-0.02, 1.02])
 
-    plt.tight_layout()
+    if standalone:
+        fig.tight_layout()
     return fig
 
 
-def example_3_calibration_plot():
+def example_3_calibration_plot(ax=None):
     """Example 3: Calibration plot (reliability diagram)."""
     print("Creating Example 3: Calibration plot...")
 
-    fig, ax = plt.subplots(figsize=(10, 8))
+    standalone = ax is None
+    fig, ax = _get_axes(ax, figsize=(10, 8))
 
     # Generate sample data
     y_true, predictions = generate_sample_predictions()
@@ -152,7 +189,9 @@ def example_3_calibration_plot():
     # Get color
     colors = get_palette('health')
 
-    if SKLEARN_AVAILABLE:
+    if _sklearn_available():
+        from sklearn.calibration import calibration_curve
+
         # Calculate calibration for first model
         fraction_of_positives, mean_predicted_value = calibration_curve(
             y_true, predictions[0], n_bins=10, strategy='uniform'
@@ -164,8 +203,9 @@ def example_3_calibration_plot():
                label='Model Calibration', markeredgecolor='white', markeredgewidth=1.5)
     else:
         # Simulated calibration
+        rng = np.random.default_rng(42)
         x = np.linspace(0, 1, 10)
-        y = x + np.random.normal(0, 0.05, 10)
+        y = x + rng.normal(0, 0.05, 10)
         ax.plot(x, y, 'o-', color=colors[0], linewidth=2.5, markersize=8,
                label='Model Calibration', markeredgecolor='white', markeredgewidth=1.5)
 
@@ -181,15 +221,17 @@ def example_3_calibration_plot():
     ax.set_xlim([-0.02, 1.02])
     ax.set_ylim([-0.02, 1.02])
 
-    plt.tight_layout()
+    if standalone:
+        fig.tight_layout()
     return fig
 
 
-def example_4_feature_importance():
+def example_4_feature_importance(ax=None):
     """Example 4: Feature importance bar chart."""
     print("Creating Example 4: Feature importance...")
 
-    fig, ax = plt.subplots(figsize=(10, 8))
+    standalone = ax is None
+    fig, ax = _get_axes(ax, figsize=(10, 8))
 
     # Sample features and importances
     features = [
@@ -202,7 +244,7 @@ def example_4_feature_importance():
 
     # Sort by importance
     sorted_idx = np.argsort(importances)
-    sorted_features = [features[i] for i in sorted_idx]
+    sorted_features = np.asarray(features)[sorted_idx].tolist()
     sorted_importances = importances[sorted_idx]
 
     # Get color
@@ -223,15 +265,17 @@ def example_4_feature_importance():
     for i, v in enumerate(sorted_importances):
         ax.text(v + 0.005, i, f'{v:.3f}', va='center', fontsize=9)
 
-    plt.tight_layout()
+    if standalone:
+        fig.tight_layout()
     return fig
 
 
-def example_5_confusion_matrix():
+def example_5_confusion_matrix(ax=None):
     """Example 5: Confusion matrix heatmap."""
     print("Creating Example 5: Confusion matrix...")
 
-    fig, ax = plt.subplots(figsize=(8, 7))
+    standalone = ax is None
+    fig, ax = _get_axes(ax, figsize=(8, 7))
 
     # Sample confusion matrix
     confusion = np.array([
@@ -243,10 +287,10 @@ def example_5_confusion_matrix():
     from oxford_matplotlib_theme.colors import OXFORD_COLORS
 
     # Create heatmap
-    im = ax.imshow(confusion, cmap='Blues', alpha=0.8)
+    im = ax.imshow(confusion, cmap=_get_cmap('Blues'), alpha=0.8)
 
     # Add colorbar
-    cbar = plt.colorbar(im, ax=ax)
+    cbar = fig.colorbar(im, ax=ax)
     cbar.set_label('Count', rotation=270, labelpad=20, fontsize=11)
 
     # Set ticks
@@ -255,12 +299,11 @@ def example_5_confusion_matrix():
     ax.set_xticklabels(['Predicted Negative', 'Predicted Positive'], fontsize=11)
     ax.set_yticklabels(['Actual Negative', 'Actual Positive'], fontsize=11)
 
-    # Add text annotations
-    for i in range(2):
-        for j in range(2):
-            text = ax.text(j, i, confusion[i, j],
-                         ha="center", va="center", color="black" if confusion[i, j] > 400 else "white",
-                         fontsize=20, fontweight='bold')
+    # Add text annotations (dark text on light cells, light text on dark cells)
+    text_colors = np.where(confusion > 400, 'black', 'white')
+    text_kw = dict(ha='center', va='center', fontsize=20, fontweight='bold')
+    for (i, j), value in np.ndenumerate(confusion):
+        ax.text(j, i, value, color=text_colors[i, j], **text_kw)
 
     # Add metrics as text
     accuracy = (confusion[0,0] + confusion[1,1]) / confusion.sum()
@@ -273,41 +316,48 @@ def example_5_confusion_matrix():
 
     ax.set_title('Confusion Matrix - Clinical Prediction Model', fontsize=14, fontweight='bold', pad=15)
 
-    plt.tight_layout()
+    if standalone:
+        fig.tight_layout()
     return fig
 
 
-def example_6_survival_curves():
+def example_6_survival_curves(ax=None):
     """Example 6: Kaplan-Meier style survival curves."""
+    from matplotlib.collections import PolyCollection
+
     print("Creating Example 6: Survival curves...")
 
-    fig, ax = plt.subplots(figsize=(10, 8))
+    standalone = ax is None
+    fig, ax = _get_axes(ax, figsize=(10, 8))
 
     # Generate sample survival data
-    np.random.seed(42)
     time = np.linspace(0, 60, 100)  # 60 months follow-up
 
-    # Simulated survival for different treatment groups
-    survival1 = np.exp(-0.02 * time)  # Treatment A
-    survival2 = np.exp(-0.03 * time)  # Treatment B
-    survival3 = np.exp(-0.04 * time)  # Control
+    # Simulated survival for different treatment groups (Treatment A, Treatment B, Control)
+    hazards = np.array([0.02, 0.03, 0.04])
+    survivals = np.exp(-hazards[:, np.newaxis] * time)
+    group_names = ['Treatment A', 'Treatment B', 'Control']
 
     # Get colors
     colors = get_palette('traditional', n_colors=3)
 
     # Plot survival curves
-    ax.plot(time, survival1, color=colors[0], linewidth=2.5,
-           label='Treatment A', drawstyle='steps-post')
-    ax.plot(time, survival2, color=colors[1], linewidth=2.5,
-           label='Treatment B', drawstyle='steps-post')
-    ax.plot(time, survival3, color=colors[2], linewidth=2.5,
-           label='Control', drawstyle='steps-post')
-
-    # Add confidence intervals (simulated)
-    for survival, color in zip([survival1, survival2, survival3], colors):
-        ci_lower = survival - 0.05
-        ci_upper = survival + 0.05
-        ax.fill_between(time, ci_lower, ci_upper, color=color, alpha=0.2, step='post')
+    for survival, name, color in zip(survivals, group_names, colors):
+        ax.plot(time, survival, color=color, linewidth=2.5,
+                label=name, drawstyle='steps-post')
+
+    # Add confidence intervals (simulated) as a single collection of step-post bands
+    step_time = np.repeat(time, 2)[1:]
+    step_lower = np.repeat(survivals - 0.05, 2, axis=1)[:, :-1]
+    step_upper = np.repeat(survivals + 0.05, 2, axis=1)[:, :-1]
+    verts = [
+        np.column_stack([np.concatenate([step_time, step_time[::-1]]),
+                         np.concatenate([upper, lower[::-1]])])
+        for lower, upper in zip(step_lower, step_upper)
+    ]
+    # Rasterized so pan/zoom redraws and vector exports don't re-render the translucent bands
+    ax.add_collection(PolyCollection(verts, facecolors=colors, edgecolors='none', alpha=0.2,
+                                     rasterized=True))
 
     # Styling
     ax.set_xlabel('Time (months)', fontsize=12)
@@ -324,40 +374,75 @@ def example_6_survival_curves():
            fontsize=8, verticalalignment='bottom', fontfamily='monospace',
            bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
 
-    plt.tight_layout()
+    if standalone:
+        fig.tight_layout()
     return fig
 
 
-def main():
-    """Run all examples and display them."""
+def main(combined=False):
+    """
+    Run all examples and display them.
+
+    With ``combined=True`` the examples share a single 2x3 figure grid.
+    """
+    # Render off-screen with Agg and save PNGs instead of opening windows when
+    # OMT_HEADLESS is 1/true/yes or --save is passed (CI, batch jobs).
+    # An explicit MPLBACKEND is respected.
+    headless = (
+        os.environ.get('OMT_HEADLESS', '').lower() in {'1', 'true', 'yes'}
+        or '--save' in sys.argv[1:]
+    )
+    if headless and 'MPLBACKEND' not in os.environ:
+        import matplotlib
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from oxford_matplotlib_theme import apply_oxford_theme
+
+    # Apply Oxford theme
+    apply_oxford_theme()
+
     print("=" * 70)
     print("Oxford Matplotlib Theme - Clinical ML Examples")
     print("=" * 70)
     print()
 
-    if not SKLEARN_AVAILABLE:
+    if not _sklearn_available():
         print("Note: scikit-learn not found. Using simulated metrics.")
         print()
 
     # Create all examples
-    examples = [
-        example_1_roc_curve(),
-        example_2_precision_recall(),
-        example_3_calibration_plot(),
-        example_4_feature_importance(),
-        example_5_confusion_matrix(),
-        example_6_survival_curves(),
+    example_funcs = [
+        example_1_roc_curve,
+        example_2_precision_recall,
+        example_3_calibration_plot,
+        example_4_feature_importance,
+        example_5_confusion_matrix,
+        example_6_survival_curves,
     ]
+    if combined:
+        # Draw every example into one figure grid instead of one figure each
+        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+        for func, ax in zip(example_funcs, axes.flat):
+            func(ax=ax)
+        fig.tight_layout()
+        figures = [fig]
+    else:
+        figures = [func() for func in example_funcs]
 
     print()
     print("=" * 70)
-    print(f"Created {len(examples)} example figures")
-    print("Close the figure windows to exit")
+    print(f"Created {len(example_funcs)} examples in {len(figures)} figure(s)")
     print("=" * 70)
 
+    if headless:
+        for i, fig in enumerate(figures, 1):
+            fig.savefig(f'clinical_ml_example_{i}.png', dpi=100)
+        return
+
     # Show all figures
+    print("Close the figure windows to exit")
     plt.show()
 
 
 if __name__ == '__main__':
-    main()
+    main(combined='--combined' in sys.argv[1:])
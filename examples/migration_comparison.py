@@ -7,7 +7,9 @@ This demonstrates how to migrate from oxford-plotly-theme to
 oxford-matplotlib-theme with equivalent functionality.
 """
 
-import numpy as np
+import contextlib
+import io
+import sys
 
 
 def print_header(title):
@@ -298,43 +300,52 @@ add_oxford_branding(
 
 def main():
     """Run all migration examples."""
-    print("\n" + "=" * 70)
-    print("OXFORD THEME: PLOTLY → MATPLOTLIB MIGRATION GUIDE")
-    print("=" * 70)
-    print("\nThis guide shows code comparisons for migrating from oxford-plotly-theme")
-    print("to oxford-matplotlib-theme. Both themes maintain identical Oxford branding,")
-    print("but matplotlib offers better performance and no browser dependencies.")
-    print()
-
-    # Run all examples
-    example_1_basic_line_plot()
-    example_2_multi_series_plot()
-    example_3_custom_colors()
-    example_4_export_figures()
-    example_5_subplots()
-    example_6_presets()
-    example_7_journal_export()
-    example_8_branding()
-
-    print("\n" + "=" * 70)
-    print("SUMMARY OF BENEFITS")
-    print("=" * 70)
-    print("\nMatplotlib version advantages:")
-    print("  - No browser/kaleido dependency for image export")
-    print("  - Faster rendering and export")
-    print("  - Native support for more formats (PDF, EPS, TIFF)")
-    print("  - Built-in theme presets (presentation, poster, colorblind, etc.)")
-    print("  - Journal-specific export presets")
-    print("  - Better integration with scientific Python ecosystem")
-    print("  - Smaller file sizes for vector formats")
-    print()
-    print("Maintained features:")
-    print("  • All 36 official Oxford colors")
-    print("  • All 12 color palettes")
-    print("  • Oxford Blue styling for axes and labels")
-    print("  • Arial/Helvetica fonts")
-    print("  • Watermark/branding support")
-    print("=" * 70)
+    # Collect the whole guide in memory and emit it with a single write, rather
+    # than paying a locked, flushed stdout write for every print() call
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            print("\n" + "=" * 70)
+            print("OXFORD THEME: PLOTLY → MATPLOTLIB MIGRATION GUIDE")
+            print("=" * 70)
+            print("\nThis guide shows code comparisons for migrating from oxford-plotly-theme")
+            print("to oxford-matplotlib-theme. Both themes maintain identical Oxford branding,")
+            print("but matplotlib offers better performance and no browser dependencies.")
+            print()
+
+            # Run all examples
+            example_1_basic_line_plot()
+            example_2_multi_series_plot()
+            example_3_custom_colors()
+            example_4_export_figures()
+            example_5_subplots()
+            example_6_presets()
+            example_7_journal_export()
+            example_8_branding()
+
+            print("\n" + "=" * 70)
+            print("SUMMARY OF BENEFITS")
+            print("=" * 70)
+            print("\nMatplotlib version advantages:")
+            print("  - No browser/kaleido dependency for image export")
+            print("  - Faster rendering and export")
+            print("  - Native support for more formats (PDF, EPS, TIFF)")
+            print("  - Built-in theme presets (presentation, poster, colorblind, etc.)")
+            print("  - Journal-specific export presets")
+            print("  - Better integration with scientific Python ecosystem")
+            print("  - Smaller file sizes for vector formats")
+            print()
+            print("Maintained features:")
+            print("  • All 36 official Oxford colors")
+            print("  • All 12 color palettes")
+            print("  • Oxford Blue styling for axes and labels")
+            print("  • Arial/Helvetica fonts")
+            print("  • Watermark/branding support")
+            print("=" * 70)
+    finally:
+        # Emit whatever was collected, even if an example raised part-way through
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
 
 
 if __name__ == '__main__':
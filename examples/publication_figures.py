@@ -3,41 +3,101 @@ Oxford Matplotlib Theme - Publication-Ready Figures
 ===================================================
 Demonstrates creating multi-panel journal-ready figures with proper sizing
 and formatting for academic publications.
+
+With OMT_HEADLESS=1 (or the --save flag) figures are rendered with the Agg
+backend and saved as PNGs. For other batch use, set MPLBACKEND=Agg.
 """
 
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.gridspec import GridSpec
-from oxford_matplotlib_theme import (
-    apply_oxford_theme,
-    get_palette,
-    get_journal_preset,
-    save_oxford_figure,
-    add_oxford_branding
-)
+import os
+import sys
+from functools import lru_cache
 
-# Apply Oxford theme
-apply_oxford_theme()
+import numpy as np
+from oxford_matplotlib_theme import get_palette
+
+# matplotlib (and the matplotlib-backed parts of the theme) are imported inside
+# the functions so that importing this module stays cheap.
+#
+# Dense layers (scatter clouds) are rasterized so vector exports embed them as
+# a single image while axes, text and single shapes such as boxes, violins and
+# bands stay vector.
+
+
+@lru_cache(maxsize=None)
+def _synthetic(kind, seed=42):
+    """
+    Generate the synthetic data for an example panel, memoized per (kind, seed).
+
+    Arrays are returned read-only because they are shared between calls.
+    Grouped datasets are shaped (n_samples, n_groups) so boxplot/violinplot
+    treat each column as one group.
+    """
+    rng = np.random.default_rng(seed)
+    if kind == 'regression':
+        x = rng.uniform(0, 100, 50)
+        arrays = (x, 2 * x + 10 + rng.normal(0, 15, 50))
+    elif kind == 'treatment_groups':
+        arrays = (rng.normal(100, 15, (100, 4)),)
+    elif kind == 'time_series':
+        arrays = (np.cumsum(rng.standard_normal(100)),)
+    elif kind == 'feature_matrix':
+        arrays = (rng.standard_normal((10, 10)),)
+    elif kind == 'variability':
+        arrays = (rng.normal(0, np.arange(1, 5), (100, 4)),)
+    elif kind == 'plos_groups':
+        arrays = (rng.normal([100, 110, 95], 10, (100, 3)),)
+    else:
+        raise ValueError(f"Unknown synthetic dataset '{kind}'")
+
+    for array in arrays:
+        array.setflags(write=False)
+    return arrays
+
+
+def _prepare_figure(fig, figsize):
+    """
+    Return a constrained-layout figure of ``figsize``.
+
+    A reused ``fig`` is cleared and resized. Constrained layout is resolved
+    once at draw time, so no ``tight_layout()`` pass is needed and figures can
+    be saved with ``bbox_inches=None``.
+    """
+    if fig is None:
+        import matplotlib.pyplot as plt
+        return plt.figure(figsize=figsize, layout='constrained')
+    fig.clear()
+    fig.set_size_inches(figsize)
+    fig.set_layout_engine('constrained')
+    return fig
 
 
-def example_1_2x2_panel():
+def example_1_2x2_panel(fig=None):
     """Example 1: 2x2 multi-panel figure for publications."""
+    from matplotlib.collections import LineCollection
+    from matplotlib.gridspec import GridSpec
+    from matplotlib.lines import Line2D
+
     print("Creating Example 1: 2x2 multi-panel figure...")
 
-    fig = plt.figure(figsize=(12, 10))
-    gs = GridSpec(2, 2, figure=fig, hspace=0.3, wspace=0.3)
+    fig = _prepare_figure(fig, (12, 10))
+    gs = GridSpec(2, 2, figure=fig)
 
     colors = get_palette('primary', n_colors=4)
 
     # Panel A: Line plot
+    # All curves go into one LineCollection (a single draw call); proxy Line2D
+    # handles stand in for the per-line legend labels a collection cannot carry.
     ax1 = fig.add_subplot(gs[0, 0])
     x = np.linspace(0, 10, 100)
-    ax1.plot(x, np.sin(x), color=colors[0], linewidth=2, label='sin(x)')
-    ax1.plot(x, np.cos(x), color=colors[1], linewidth=2, label='cos(x)')
+    curves = np.stack([np.sin(x), np.cos(x)])
+    segments = np.stack([np.broadcast_to(x, curves.shape), curves], axis=-1)
+    ax1.add_collection(LineCollection(segments, colors=colors[:2], linewidths=2))
+    ax1.autoscale()
+    handles = [Line2D([], [], color=color, linewidth=2) for color in colors[:2]]
     ax1.set_xlabel('Time (s)')
     ax1.set_ylabel('Amplitude')
     ax1.set_title('(A) Temporal Pattern', fontweight='bold', loc='left')
-    ax1.legend(fontsize=9)
+    ax1.legend(handles, ['sin(x)', 'cos(x)'], fontsize=9)
     ax1.grid(True, alpha=0.3)
 
     # Panel B: Bar chart
@@ -50,15 +110,15 @@ def example_1_2x2_panel():
     ax2.set_ylabel('Response Rate (%)')
     ax2.set_title('(B) Treatment Efficacy', fontweight='bold', loc='left')
     ax2.grid(True, axis='y', alpha=0.3)
-    plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45, ha='right')
+    for label in ax2.get_xticklabels():
+        label.set_rotation(45)
+        label.set_horizontalalignment('right')
 
     # Panel C: Scatter plot with regression
     ax3 = fig.add_subplot(gs[1, 0])
-    np.random.seed(42)
-    x_data = np.random.uniform(0, 100, 50)
-    y_data = 2 * x_data + 10 + np.random.normal(0, 15, 50)
+    x_data, y_data = _synthetic('regression')
     ax3.scatter(x_data, y_data, s=80, color=colors[2], alpha=0.6,
-                edgecolors='white', linewidth=0.5)
+                edgecolors='white', linewidth=0.5, rasterized=True)
 
     # Add regression line
     z = np.polyfit(x_data, y_data, 1)
@@ -75,12 +135,11 @@ def example_1_2x2_panel():
 
     # Panel D: Box plot
     ax4 = fig.add_subplot(gs[1, 1])
-    data = [np.random.normal(100, 15, 100) for _ in range(4)]
+    data, = _synthetic('treatment_groups')
     bp = ax4.boxplot(data, labels=categories, patch_artist=True, widths=0.6)
 
     for patch, color in zip(bp['boxes'], colors):
-        patch.set_facecolor(color)
-        patch.set_alpha(0.7)
+        patch.set(facecolor=color, alpha=0.7)
 
     for median in bp['medians']:
         median.set(color='#002147', linewidth=2)
@@ -88,30 +147,30 @@ def example_1_2x2_panel():
     ax4.set_ylabel('Measurement Value')
     ax4.set_title('(D) Distribution Comparison', fontweight='bold', loc='left')
     ax4.grid(True, axis='y', alpha=0.3)
-    plt.setp(ax4.xaxis.get_majorticklabels(), rotation=45, ha='right')
+    for label in ax4.get_xticklabels():
+        label.set_rotation(45)
+        label.set_horizontalalignment('right')
 
     # Overall title
     fig.suptitle('Comprehensive Analysis of Treatment Effects',
-                 fontsize=16, fontweight='bold', y=0.98)
+                 fontsize=16, fontweight='bold')
 
     return fig
 
 
-def example_2_3panel_horizontal():
+def example_2_3panel_horizontal(fig=None):
     """Example 2: 3-panel horizontal figure."""
     print("Creating Example 2: 3-panel horizontal figure...")
 
-    fig, axes = plt.subplots(1, 3, figsize=(15, 5))
+    fig = _prepare_figure(fig, (15, 5))
+    axes = fig.subplots(1, 3)
 
     colors = get_palette('vibrant', n_colors=3)
 
-    # Generate sample data
-    np.random.seed(42)
-
     # Panel A: Time series
     ax = axes[0]
     time = np.arange(0, 100)
-    signal = np.cumsum(np.random.randn(100))
+    signal, = _synthetic('time_series')
     ax.plot(time, signal, color=colors[0], linewidth=2)
     ax.fill_between(time, signal - 5, signal + 5, color=colors[0], alpha=0.2)
     ax.set_xlabel('Time Point')
@@ -121,24 +180,23 @@ def example_2_3panel_horizontal():
 
     # Panel B: Heatmap
     ax = axes[1]
-    data_2d = np.random.randn(10, 10)
+    data_2d, = _synthetic('feature_matrix')
     im = ax.imshow(data_2d, cmap='RdBu_r', aspect='auto', vmin=-2, vmax=2)
     ax.set_xlabel('Feature Index')
     ax.set_ylabel('Sample Index')
     ax.set_title('(B) Feature Matrix', fontweight='bold', loc='left')
-    cbar = plt.colorbar(im, ax=ax)
+    cbar = fig.colorbar(im, ax=ax)
     cbar.set_label('Value', rotation=270, labelpad=15)
 
     # Panel C: Violin plot
     ax = axes[2]
-    data_violin = [np.random.normal(0, std, 100) for std in range(1, 5)]
+    data_violin, = _synthetic('variability')
     parts = ax.violinplot(data_violin, positions=range(1, 5),
                            showmeans=True, showmedians=True)
 
     # Color the violins
     for pc, color in zip(parts['bodies'], colors):
-        pc.set_facecolor(color)
-        pc.set_alpha(0.7)
+        pc.set(facecolor=color, alpha=0.7)
 
     ax.set_xlabel('Group')
     ax.set_ylabel('Distribution')
@@ -147,23 +205,23 @@ def example_2_3panel_horizontal():
     ax.set_xticklabels([f'G{i}' for i in range(1, 5)])
     ax.grid(True, axis='y', alpha=0.3)
 
-    plt.tight_layout()
-
     return fig
 
 
-def example_3_journal_nature():
+def example_3_journal_nature(fig=None):
     """Example 3: Nature journal single-column figure."""
+    from oxford_matplotlib_theme import get_journal_preset
+
     print("Creating Example 3: Nature single-column figure...")
 
     # Get Nature preset
     preset = get_journal_preset('nature')
 
-    fig, ax = plt.subplots(figsize=preset['figsize'])
+    fig = _prepare_figure(fig, preset['figsize'])
+    ax = fig.subplots()
 
     # Create publication-quality plot
     colors = get_palette('professional', n_colors=2)
-    np.random.seed(42)
 
     x = np.linspace(0, 5, 100)
     y1 = np.exp(-x) * np.cos(2 * np.pi * x)
@@ -180,8 +238,6 @@ def example_3_journal_nature():
     # Adjust tick label size for journal
     ax.tick_params(labelsize=7)
 
-    plt.tight_layout()
-
     print(f"  Figure size: {preset['figsize']} inches")
     print(f"  Recommended DPI: {preset['dpi']}")
     print(f"  Recommended format: {preset['format']}")
@@ -189,26 +245,28 @@ def example_3_journal_nature():
     return fig
 
 
-def example_4_journal_plos():
+def example_4_journal_plos(fig=None):
     """Example 4: PLOS journal double-column figure."""
+    from oxford_matplotlib_theme import get_journal_preset
+
     print("Creating Example 4: PLOS double-column figure...")
 
     # Get PLOS preset
     preset = get_journal_preset('plos')
 
-    fig, axes = plt.subplots(1, 2, figsize=preset['figsize'])
+    fig = _prepare_figure(fig, preset['figsize'])
+    axes = fig.subplots(1, 2)
 
     colors = get_palette('health', n_colors=3)
 
     # Left panel: Box plot comparison
     ax = axes[0]
-    data = [np.random.normal(loc, 10, 100) for loc in [100, 110, 95]]
+    data, = _synthetic('plos_groups')
     bp = ax.boxplot(data, labels=['Group 1', 'Group 2', 'Group 3'],
                      patch_artist=True, widths=0.6)
 
     for patch, color in zip(bp['boxes'], colors):
-        patch.set_facecolor(color)
-        patch.set_alpha(0.8)
+        patch.set(facecolor=color, alpha=0.8)
 
     for median in bp['medians']:
         median.set(color='#002147', linewidth=2)
@@ -231,8 +289,6 @@ def example_4_journal_plos():
     ax.set_title('B', fontweight='bold', loc='left', fontsize=12)
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-
     print(f"  Figure size: {preset['figsize']} inches")
     print(f"  Recommended DPI: {preset['dpi']}")
     print(f"  Recommended format: {preset['format']}")
@@ -242,26 +298,55 @@ def example_4_journal_plos():
 
 def main():
     """Run all examples."""
+    # Render off-screen with Agg and save PNGs instead of opening windows when
+    # OMT_HEADLESS is 1/true/yes or --save is passed (CI, batch jobs).
+    # An explicit MPLBACKEND is respected.
+    headless = (
+        os.environ.get('OMT_HEADLESS', '').lower() in {'1', 'true', 'yes'}
+        or '--save' in sys.argv[1:]
+    )
+    if headless and 'MPLBACKEND' not in os.environ:
+        import matplotlib
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from oxford_matplotlib_theme import apply_oxford_theme
+
+    # Apply Oxford theme
+    apply_oxford_theme()
+
     print("=" * 70)
     print("Oxford Matplotlib Theme - Publication Figure Examples")
     print("=" * 70)
     print()
 
-    # Create examples
-    examples = [
-        example_1_2x2_panel(),
-        example_2_3panel_horizontal(),
-        example_3_journal_nature(),
-        example_4_journal_plos(),
+    builders = [
+        example_1_2x2_panel,
+        example_2_3panel_horizontal,
+        example_3_journal_nature,
+        example_4_journal_plos,
     ]
 
+    if headless:
+        # Nothing is shown, so reuse one Figure: each builder clears and resizes it
+        fig = plt.figure()
+        for i, builder in enumerate(builders, 1):
+            builder(fig)
+            fig.savefig(f'publication_figures_example_{i}.png', dpi=100, bbox_inches=None)
+    else:
+        for builder in builders:
+            builder()
+
     print()
     print("=" * 70)
-    print(f"Created {len(examples)} publication-ready figures")
+    print(f"Created {len(builders)} publication-ready figures")
     print()
     print("To save for journal submission:")
-    print("  save_oxford_figure(fig, 'figure1', format='svg', dpi=300)")
+    print("  save_oxford_figure(fig, 'figure1', format='svg', dpi=300, bbox_inches=None)")
     print()
+    if headless:
+        print("=" * 70)
+        return
+
     print("Close the figure windows to exit")
     print("=" * 70)
 
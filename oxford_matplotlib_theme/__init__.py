@@ -63,10 +63,14 @@ __version__ = '1.0.0'
 __author__ = 'Sami Adnan'
 __license__ = 'MIT'
 
-# Import color definitions
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Import color definitions (pure data, no matplotlib dependency)
 from .colors import (
     OxfordColors,
     OXFORD_COLORS,
+    OXFORD_COLORS_RGB,
     OXFORD_PALETTE,
     ColorPalettes,
     get_color,
@@ -74,32 +78,77 @@ from .colors import (
     get_color_palette,
 )
 
-# Import style functions
-from .styles import (
-    apply_oxford_theme,
-    reset_theme,
-    oxford_figure,
-    get_oxford_rcparams,
-)
+# Style and preset functions import matplotlib, so they are loaded on first
+# attribute access (PEP 562) rather than at package import time. Utilities are
+# loaded the same way; reading journal presets still never imports matplotlib.
+_LAZY_IMPORTS = {
+    # Style functions
+    'apply_oxford_theme': '.styles',
+    'reset_theme': '.styles',
+    'oxford_figure': '.styles',
+    'get_oxford_rcparams': '.styles',
+    'get_oxford_cycler': '.styles',
+    'get_oxford_cmap': '.styles',
+
+    # Preset functions
+    'apply_preset': '.presets',
+    'list_presets': '.presets',
+    'get_preset_config': '.presets',
+    'get_preset_descriptions': '.presets',
+    'PRESETS': '.presets',
+
+    # Utility functions
+    'add_oxford_branding': '.utils',
+    'save_oxford_figure': '.utils',
+    'save_oxford_figures': '.utils',
+    'get_journal_preset': '.utils',
+    'JOURNAL_PRESETS': '.utils',
+    'PUBLICATION_DPI': '.utils',
+    'PUBLICATION_DPI_HIGH': '.utils',
+    'SUPPORTED_FORMATS': '.utils',
+}
+
+if TYPE_CHECKING:
+    from .styles import (
+        apply_oxford_theme,
+        reset_theme,
+        oxford_figure,
+        get_oxford_rcparams,
+        get_oxford_cycler,
+        get_oxford_cmap,
+    )
+    from .presets import (
+        apply_preset,
+        list_presets,
+        get_preset_config,
+        get_preset_descriptions,
+        PRESETS,
+    )
+    from .utils import (
+        add_oxford_branding,
+        save_oxford_figure,
+        save_oxford_figures,
+        get_journal_preset,
+        JOURNAL_PRESETS,
+        PUBLICATION_DPI,
+        PUBLICATION_DPI_HIGH,
+        SUPPORTED_FORMATS,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily-loaded public names from their submodule on first access."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so __getattr__ is not hit again
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
 
-# Import preset functions
-from .presets import (
-    apply_preset,
-    list_presets,
-    get_preset_config,
-    PRESETS,
-)
-
-# Import utility functions
-from .utils import (
-    add_oxford_branding,
-    save_oxford_figure,
-    get_journal_preset,
-    JOURNAL_PRESETS,
-    PUBLICATION_DPI,
-    PUBLICATION_DPI_HIGH,
-    SUPPORTED_FORMATS,
-)
 
 # Define public API
 __all__ = [
@@ -108,10 +157,13 @@ __all__ = [
     'reset_theme',
     'oxford_figure',
     'get_oxford_rcparams',
+    'get_oxford_cycler',
+    'get_oxford_cmap',
 
     # Color access
     'OxfordColors',
     'OXFORD_COLORS',
+    'OXFORD_COLORS_RGB',
     'OXFORD_PALETTE',
     'ColorPalettes',
     'get_color',
@@ -122,11 +174,13 @@ __all__ = [
     'apply_preset',
     'list_presets',
     'get_preset_config',
+    'get_preset_descriptions',
     'PRESETS',
 
     # Utilities
     'add_oxford_branding',
     'save_oxford_figure',
+    'save_oxford_figures',
     'get_journal_preset',
     'JOURNAL_PRESETS',
     'PUBLICATION_DPI',
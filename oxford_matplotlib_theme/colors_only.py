@@ -0,0 +1,32 @@
+"""
+Oxford Colors (Lightweight Entry Point)
+=======================================
+Matplotlib-free access to the Oxford color definitions and palettes.
+
+For documentation generators, LaTeX pipelines and other tools that only need
+the hex codes. Importing this module never imports matplotlib.
+
+>>> from oxford_matplotlib_theme.colors_only import OXFORD_COLORS, get_palette
+"""
+
+from .colors import (
+    OxfordColors,
+    ColorPalettes,
+    OXFORD_COLORS,
+    OXFORD_COLORS_RGB,
+    OXFORD_PALETTE,
+    get_color,
+    get_palette,
+    get_color_palette,
+)
+
+__all__ = [
+    'OxfordColors',
+    'ColorPalettes',
+    'OXFORD_COLORS',
+    'OXFORD_COLORS_RGB',
+    'OXFORD_PALETTE',
+    'get_color',
+    'get_palette',
+    'get_color_palette',
+]
@@ -4,7 +4,7 @@ Oxford Theme Presets
 Pre-configured Oxford theme variants for different use cases.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 from .styles import apply_oxford_theme
 
 
@@ -113,7 +113,7 @@ def apply_preset(preset_name: str) -> None:
     get_preset_config : Get preset configuration dict
     apply_oxford_theme : Apply theme with custom parameters
     """
-    preset_name_lower = preset_name.lower()
+    preset_name_lower = preset_name if preset_name in PRESETS else preset_name.lower()
 
     if preset_name_lower not in PRESETS:
         available = ', '.join(sorted(PRESETS.keys()))
@@ -131,6 +131,32 @@ def apply_preset(preset_name: str) -> None:
     )
 
 
+def get_preset_descriptions() -> List[Tuple[str, str]]:
+    """
+    Get the name and description of every preset.
+
+    Structured counterpart of :func:`list_presets`, for code that needs the
+    preset listing as data rather than printed text.
+
+    Returns
+    -------
+    list of (str, str)
+        ``(name, description)`` pairs sorted by preset name
+
+    Examples
+    --------
+    >>> from oxford_matplotlib_theme import get_preset_descriptions
+    >>> dict(get_preset_descriptions())['presentation']
+    'Larger fonts and elements for slides'
+
+    See Also
+    --------
+    list_presets : Print the presets as a table
+    get_preset_config : Get preset configuration
+    """
+    return [(name, config['description']) for name, config in sorted(PRESETS.items())]
+
+
 def list_presets() -> None:
     """
     Print a formatted table of all available presets.
@@ -157,18 +183,23 @@ def list_presets() -> None:
     --------
     apply_preset : Apply a preset
     get_preset_config : Get preset configuration
+    get_preset_descriptions : Get the listing as data
     """
-    print("Available Oxford Theme Presets:")
-    print("=" * 70)
-    print(f"{'Name':<15} {'Description':<55}")
-    print("-" * 70)
-
-    for name in sorted(PRESETS.keys()):
-        desc = PRESETS[name]['description']
-        print(f"{name:<15} {desc:<55}")
+    # Build the whole table and write it with a single print call
+    lines = [
+        "Available Oxford Theme Presets:",
+        "=" * 70,
+        f"{'Name':<15} {'Description':<55}",
+        "-" * 70,
+    ]
+    lines.extend(
+        f"{name:<15} {description:<55}"
+        for name, description in get_preset_descriptions()
+    )
+    lines.append("=" * 70)
+    lines.append("\nUsage: apply_preset('preset_name')")
 
-    print("=" * 70)
-    print("\nUsage: apply_preset('preset_name')")
+    print("\n".join(lines))
 
 
 def get_preset_config(preset_name: str) -> Dict[str, Any]:
@@ -214,7 +245,7 @@ def get_preset_config(preset_name: str) -> Dict[str, Any]:
     apply_preset : Apply a preset
     list_presets : List all presets
     """
-    preset_name_lower = preset_name.lower()
+    preset_name_lower = preset_name if preset_name in PRESETS else preset_name.lower()
 
     if preset_name_lower not in PRESETS:
         available = ', '.join(sorted(PRESETS.keys()))
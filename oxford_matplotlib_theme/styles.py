@@ -4,13 +4,260 @@ Oxford University Matplotlib Styling
 Functions to apply Oxford University styling to Matplotlib figures.
 """
 
+import re
+from collections import ChainMap
+from functools import lru_cache
+from types import MappingProxyType
+
+import matplotlib as mpl
 import matplotlib.pyplot as plt
-from cycler import cycler
+from cycler import Cycler, cycler
+from matplotlib import font_manager
+from matplotlib.colors import ListedColormap
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
-from typing import Optional, List, Tuple
+from typing import Any, Dict, ItemsView, Mapping, Optional, List, Tuple, cast
+
+from .colors import OXFORD_PALETTE, OXFORD_COLORS, _AVAILABLE_COLORS
+
+# rcParams that plt.style.use() ignores; styles setting any of these are
+# resolved through plt.style.use() instead
+try:
+    # matplotlib >= 3.11 deprecates matplotlib.style.core (importing it warns) and
+    # keeps the set only under this private name, which its type stubs omit
+    from matplotlib.style import _STYLE_BLACKLIST as _NON_STYLE_PARAMS  # type: ignore[attr-defined]
+except ImportError:
+    from matplotlib.style.core import STYLE_BLACKLIST as _NON_STYLE_PARAMS
+
+
+# ============================================================================
+# CACHED THEME OBJECTS
+# ============================================================================
+
+def get_oxford_cycler() -> Cycler:
+    """
+    Get the color cycler for the default Oxford palette.
+
+    Cyclers are mutable (``*=`` and ``+=`` modify them in place), so each
+    call returns a new one.
+
+    Returns
+    -------
+    Cycler
+        ``cycler(color=OXFORD_PALETTE)``
+
+    Examples
+    --------
+    >>> from oxford_matplotlib_theme import get_oxford_cycler
+    >>> ax.set_prop_cycle(get_oxford_cycler())
+    """
+    return cycler(color=list(OXFORD_PALETTE))
+
+
+@lru_cache(maxsize=None)
+def get_oxford_cmap() -> ListedColormap:
+    """
+    Get a qualitative colormap built from the default Oxford palette.
+
+    Returns
+    -------
+    ListedColormap
+        Colormap named ``'oxford'`` with the 8 OXFORD_PALETTE colors
+
+    Examples
+    --------
+    >>> from oxford_matplotlib_theme import get_oxford_cmap
+    >>> ax.scatter(x, y, c=labels, cmap=get_oxford_cmap())
+    """
+    return ListedColormap(OXFORD_PALETTE, name='oxford')
+
+
+# ============================================================================
+# THEME RCPARAMS
+# ============================================================================
+
+# Call-invariant Oxford rcParams, built once at import
+_STATIC_OXFORD_RC = MappingProxyType({
+    # Oxford Blue for all axes, labels, and text
+    'axes.labelcolor': OXFORD_COLORS['oxford_blue'],
+    'axes.edgecolor': OXFORD_COLORS['oxford_blue'],
+    'text.color': OXFORD_COLORS['oxford_blue'],
+    'xtick.color': OXFORD_COLORS['oxford_blue'],
+    'ytick.color': OXFORD_COLORS['oxford_blue'],
+
+    # Font family (Oxford standard: Arial/Helvetica)
+    'font.family': 'sans-serif',
+    'font.sans-serif': ('Arial', 'Helvetica', 'DejaVu Sans', 'sans-serif'),
+
+    # Legend styling
+    'legend.frameon': True,
+    'legend.framealpha': 1.0,
+    'legend.edgecolor': OXFORD_COLORS['oxford_blue'],
+    'legend.fancybox': False,
+
+    # Background colors (white for publication)
+    'figure.facecolor': 'white',
+    'axes.facecolor': 'white',
+})
+
+# Hex color codes accepted by matplotlib: #rgb, #rgba, #rrggbb and #rrggbbaa
+_HEX_RE = re.compile(r'#(?:[0-9A-Fa-f]{3,4}|[0-9A-Fa-f]{6}|[0-9A-Fa-f]{8})')
+
+# Font-size rcParams multiplied by ``font_scale``
+_FONT_SIZE_PARAMS = (
+    'font.size',
+    'axes.labelsize',
+    'axes.titlesize',
+    'xtick.labelsize',
+    'ytick.labelsize',
+    'legend.fontsize',
+    'figure.titlesize',
+)
+
+
+def _library_style(style_base: str) -> Optional[Mapping[str, Any]]:
+    """Return the parsed rcParams of a named library style, or None for other styles."""
+    style = plt.style.library.get(style_base) if isinstance(style_base, str) else None
+    # matplotlib's stubs key RcParams on a Literal of every rcParam name; the
+    # theme looks styles up by plain str keys
+    return cast(Optional[Mapping[str, Any]], style)
+
+
+def _rc_matches(params: Mapping[str, Any]) -> bool:
+    """Return True if every rcParam in ``params`` currently holds the given value."""
+    # RcParams is a dict subclass: iterate the stored (validated) values directly,
+    # bypassing the slower MutableMapping iteration. The casts only give both
+    # sides plain str keys for the type checker.
+    current = cast(Dict[str, Any], plt.rcParams)
+    items: ItemsView[str, Any] = dict.items(cast(Dict[str, Any], params))
+    return all(current[key] == value for key, value in items)
+
+
+def _style_is_applied(style_base: str) -> bool:
+    """Return True if every rcParam set by ``style_base`` already holds the style's value."""
+    style_params = _library_style(style_base)
+    return style_params is not None and _rc_matches(style_params)
+
+
+# Arguments of the last apply_oxford_theme() call with a library style, and the
+# rcParams it left behind; an identical call is skipped while they are in place
+_last_applied: Optional[Tuple[tuple, Dict[str, Any]]] = None
+
+
+@lru_cache(maxsize=32)
+def _scaled_style_font_sizes(style_base: str, font_scale: float) -> Mapping[str, float]:
+    """Scaled font sizes for the numeric font-size rcParams set by a library style."""
+    style_params = _library_style(style_base) or {}
+    return MappingProxyType({
+        param: style_params[param] * font_scale
+        for param in _FONT_SIZE_PARAMS
+        if isinstance(style_params.get(param), (int, float))
+    })
+
+
+@lru_cache(maxsize=32)
+def _resolve_colors(color_cycle: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Validate a color cycle and memoize it as a tuple of color codes.
+
+    Names are mapped to their hex codes; invalid cycles raise, so they are
+    never cached.
+    """
+    # Report every unknown name or malformed hex code at once
+    unknown = {
+        color for color in color_cycle
+        if not _HEX_RE.fullmatch(color) and color.lower() not in OXFORD_COLORS
+    }
+    if unknown:
+        raise ValueError(
+            f"Color(s) not found: {', '.join(sorted(unknown))}. "
+            f"Available colors: {_AVAILABLE_COLORS}"
+        )
+
+    return tuple(
+        color if color[0] == '#' else OXFORD_COLORS[color.lower()]
+        for color in color_cycle
+    )
+
+
+def _resolve_prop_cycle(color_cycle: Optional[List[str]], font_scale: float) -> Cycler:
+    """Validate theme arguments and return the color cycler to apply."""
+    # Input validation
+    if font_scale <= 0:
+        raise ValueError(f"font_scale must be positive, got {font_scale}")
+
+    if color_cycle is not None and len(color_cycle) == 0:
+        raise ValueError("color_cycle cannot be empty")
+
+    if color_cycle is None:
+        return get_oxford_cycler()
+
+    # Pre-validate all colors before applying theme (to avoid partial application)
+    return cycler(color=list(_resolve_colors(tuple(color_cycle))))
+
+
+def _build_oxford_rc(
+    prop_cycle: Cycler,
+    font_scale: float,
+    base: Mapping[Any, Any],
+    style_base: Optional[str] = None
+) -> Dict[Any, Any]:
+    """
+    Build the Oxford rcParams overrides.
+
+    ``base`` holds the rcParams the overrides are layered on (after the base
+    style), either ``plt.rcParams`` itself or a mapping over it; font sizes are
+    scaled from its values. When ``style_base`` names a library style, the
+    sizes it sets come from a per-(style, scale) cache.
+    """
+    oxford_rc = {
+        **_STATIC_OXFORD_RC,
+        # Color cycle for multi-line/multi-series plots
+        'axes.prop_cycle': prop_cycle,
+    }
+
+    # Apply font scaling if requested
+    if font_scale != 1.0:
+        scaled: Mapping[str, float] = {}
+        if style_base is not None and _library_style(style_base) is not None:
+            scaled = _scaled_style_font_sizes(style_base, font_scale)
+            oxford_rc.update(scaled)
+
+        for param in _FONT_SIZE_PARAMS:
+            if param in scaled:
+                continue
+            # Only scale numeric values (some might be strings like 'medium')
+            current_value = base[param]
+            if isinstance(current_value, (int, float)):
+                oxford_rc[param] = current_value * font_scale
+
+    return oxford_rc
+
+
+@lru_cache(maxsize=16)
+def _library_overrides(
+    style_base: str,
+    colors: Optional[Tuple[str, ...]],
+    font_scale: float,
+    base_font_sizes: Tuple[Tuple[str, Any], ...]
+) -> Mapping[str, Any]:
+    """
+    Validated rcParams for a library style with the Oxford overrides on top.
 
-from .colors import OXFORD_PALETTE, OXFORD_COLORS, get_color
+    ``base_font_sizes`` holds the current values of the font size params the
+    style does not set, which scaling reads. Invalid arguments raise, so they
+    are never cached.
+    """
+    prop_cycle = _resolve_prop_cycle(None if colors is None else list(colors), font_scale)
+
+    # RcParams validates the overrides exactly as rcParams.update() would
+    overrides = mpl.RcParams(plt.style.library[style_base])
+    overrides.update(
+        _build_oxford_rc(
+            prop_cycle, font_scale, ChainMap(overrides, dict(base_font_sizes)), style_base
+        )
+    )
+    return MappingProxyType(dict(cast(Mapping[str, Any], overrides)))
 
 
 # ============================================================================
@@ -73,81 +320,52 @@ def apply_oxford_theme(
 
     >>> apply_oxford_theme(style_base='seaborn-v0_8-whitegrid')
 
+    Notes
+    -----
+    Repeating a call with the same arguments returns immediately while the
+    rcParams it set are still in place; if any of them has been changed since,
+    the theme is applied again in full.
+
     See Also
     --------
     reset_theme : Restore matplotlib defaults
     oxford_figure : Create pre-styled figure
     """
-    # Input validation
-    if font_scale <= 0:
-        raise ValueError(f"font_scale must be positive, got {font_scale}")
+    global _last_applied
 
-    if color_cycle is not None and len(color_cycle) == 0:
-        raise ValueError("color_cycle cannot be empty")
+    # Identical call whose result is still in place (e.g. in a notebook loop): no-op
+    signature = (style_base, None if color_cycle is None else tuple(color_cycle), font_scale)
+    if (
+        _last_applied is not None
+        and _last_applied[0] == signature
+        and _rc_matches(_last_applied[1])
+    ):
+        return
 
-    # Pre-validate all colors before applying theme (to avoid partial application)
-    if color_cycle is not None:
-        colors = []
-        for color in color_cycle:
-            if color.startswith('#'):
-                colors.append(color)
-            else:
-                # This will raise ValueError if color is invalid
-                colors.append(get_color(color))
-    else:
-        colors = OXFORD_PALETTE
-
-    # Apply base style first
-    plt.style.use(style_base)
-
-    # Build Oxford-specific rcParams
-    oxford_rc = {
-        # Color cycle for multi-line/multi-series plots
-        'axes.prop_cycle': cycler(color=colors),
-
-        # Oxford Blue for all axes, labels, and text
-        'axes.labelcolor': OXFORD_COLORS['oxford_blue'],
-        'axes.edgecolor': OXFORD_COLORS['oxford_blue'],
-        'text.color': OXFORD_COLORS['oxford_blue'],
-        'xtick.color': OXFORD_COLORS['oxford_blue'],
-        'ytick.color': OXFORD_COLORS['oxford_blue'],
-
-        # Font family (Oxford standard: Arial/Helvetica)
-        'font.family': 'sans-serif',
-        'font.sans-serif': ['Arial', 'Helvetica', 'DejaVu Sans', 'sans-serif'],
-
-        # Legend styling
-        'legend.frameon': True,
-        'legend.framealpha': 1.0,
-        'legend.edgecolor': OXFORD_COLORS['oxford_blue'],
-        'legend.fancybox': False,
-
-        # Background colors (white for publication)
-        'figure.facecolor': 'white',
-        'axes.facecolor': 'white',
-    }
+    prop_cycle = _resolve_prop_cycle(color_cycle, font_scale)
 
-    # Apply font scaling if requested
-    if font_scale != 1.0:
-        font_params = [
-            'font.size',
-            'axes.labelsize',
-            'axes.titlesize',
-            'xtick.labelsize',
-            'ytick.labelsize',
-            'legend.fontsize',
-            'figure.titlesize',
-        ]
-
-        for param in font_params:
-            # Only scale numeric values (some might be strings like 'medium')
-            current_value = plt.rcParams[param]
-            if isinstance(current_value, (int, float)):
-                oxford_rc[param] = current_value * font_scale
+    # Apply base style first. Re-applying the theme with the same style (e.g. in a
+    # notebook loop) finds the style's values already in place, and comparing them
+    # is cheaper than plt.style.use(); any changed value triggers a full re-apply.
+    if not _style_is_applied(style_base):
+        plt.style.use(style_base)
 
     # Update matplotlib rcParams
+    oxford_rc = _build_oxford_rc(prop_cycle, font_scale, plt.rcParams, style_base)
     plt.rcParams.update(oxford_rc)
 
+    # Remember the resulting values of every key this call set (library styles
+    # only: other styles may change between calls under the same argument)
+    style_params = _library_style(style_base)
+    _last_applied = None if style_params is None else (
+        signature,
+        {key: plt.rcParams[key] for key in (*style_params, *oxford_rc)},
+    )
+
+    # Resolve and load the themed font now, so the first figure does not pay for
+    # the font lookup (findfont and get_font are cached by matplotlib)
+    font_manager.get_font(font_manager.findfont(font_manager.FontProperties()))
+
 
 def reset_theme() -> None:
     """
@@ -168,6 +386,8 @@ def reset_theme() -> None:
     >>> # ... create plots ...
     >>> reset_theme()  # Back to matplotlib defaults
     """
+    global _last_applied
+    _last_applied = None
     plt.rcParams.update(plt.rcParamsDefault)
 
 
@@ -300,20 +520,35 @@ def get_oxford_rcparams(
     --------
     apply_oxford_theme : Apply theme globally
     """
-    # Save current rcParams
-    original_params = plt.rcParams.copy()
-
-    # Apply Oxford theme temporarily
-    apply_oxford_theme(
-        style_base=style_base,
-        color_cycle=color_cycle,
-        font_scale=font_scale
+    style_params = _library_style(style_base)
+    if style_params is None or not _NON_STYLE_PARAMS.isdisjoint(style_params):
+        # Paths, 'default', style dicts and styles with ignored keys: let
+        # matplotlib resolve the style against a throwaway copy of rcParams
+        prop_cycle = _resolve_prop_cycle(color_cycle, font_scale)
+        with plt.rc_context():
+            plt.style.use(style_base)
+            plt.rcParams.update(_build_oxford_rc(prop_cycle, font_scale, plt.rcParams, style_base))
+            return dict(plt.rcParams)
+
+    # Library styles are already parsed: layer the style and the Oxford overrides
+    # over the current rcParams without touching global state. The overrides only
+    # depend on the current rcParams through the font sizes the style leaves
+    # unset, so those are part of the cache key.
+    current = cast(Dict[str, Any], plt.rcParams)
+    base_font_sizes = () if font_scale == 1.0 else tuple(
+        (param, current[param])
+        for param in _FONT_SIZE_PARAMS
+        if param not in style_params
+    )
+    overrides = _library_overrides(
+        style_base,
+        None if color_cycle is None else tuple(color_cycle),
+        font_scale,
+        base_font_sizes,
     )
 
-    # Get the resulting rcParams
-    oxford_params = plt.rcParams.copy()
-
-    # Restore original rcParams
-    plt.rcParams.update(original_params)
-
-    return dict(oxford_params)
+    oxford_params = dict(current)
+    oxford_params.update(overrides)
+    # Cyclers are mutable, so each caller gets its own copy of the cached one
+    oxford_params['axes.prop_cycle'] = cycler(overrides['axes.prop_cycle'])
+    return oxford_params
@@ -4,10 +4,21 @@ Oxford Theme Utilities
 Utility functions for branding and exporting figures.
 """
 
-from matplotlib.figure import Figure
-from typing import Dict, Any, Literal
+import contextlib
+import io
+import os
+import pickle
+import stat
+import tempfile
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Iterator, Literal, Mapping, Optional, Sequence
 from .colors import OXFORD_COLORS
 
+# Figures arrive already constructed, so matplotlib is only needed for type
+# hints; get_journal_preset() and the constants import nothing heavy.
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
 
 # ============================================================================
 # PUBLICATION CONSTANTS
@@ -18,39 +29,70 @@ PUBLICATION_DPI = 300
 PUBLICATION_DPI_HIGH = 600  # For TIFF or high-quality print
 
 # Supported export formats
-SUPPORTED_FORMATS = {'png', 'svg', 'pdf', 'eps', 'tiff', 'jpg', 'jpeg', 'ps', 'raw', 'rgba', 'pgf'}
+SUPPORTED_FORMATS = frozenset(
+    {'png', 'svg', 'pdf', 'eps', 'tiff', 'jpg', 'jpeg', 'webp', 'ps', 'raw', 'rgba', 'pgf'}
+)
+_AVAILABLE_FORMATS = ', '.join(sorted(SUPPORTED_FORMATS))
+
+# File extension for each format, compared against the filename when saving
+_DOT_EXTENSIONS = {fmt: f'.{fmt}' for fmt in SUPPORTED_FORMATS}
+
+# Formats that skip Agg rasterization entirely
+_VECTOR_FORMATS = frozenset({'svg', 'pdf', 'eps', 'ps', 'pgf'})
+
+# Vector formats rendered into memory before writing; PGF is saved by filename
+_STREAMED_VECTOR_FORMATS = _VECTOR_FORMATS - {'pgf'}
+
+# Write buffer used by save_oxford_figure (bytes)
+_SAVE_BUFFER_SIZE = 1 << 20
+
+# Default Pillow encoder options per format, merged under any pil_kwargs the
+# caller passes. zlib level 3 encodes PNG noticeably faster than Pillow's
+# default of 6; WebP method 0 is its fastest encoder (quality 90 lossy).
+_PIL_KWARGS_DEFAULTS = {
+    'png': {'compress_level': 3},
+    'webp': {'method': 0, 'quality': 90},
+}
 
 
 # ============================================================================
 # JOURNAL EXPORT PRESETS
 # ============================================================================
 
-JOURNAL_PRESETS: Dict[str, Dict[str, Any]] = {
-    'nature': {
+# Each preset is a read-only view, so get_journal_preset() can hand it out
+# without copying. 'accepts_vector' marks journals that take PDF/EPS/SVG
+# artwork, which get_journal_preset(prefer_vector=True) switches to.
+JOURNAL_PRESETS: Dict[str, Mapping[str, Any]] = {
+    'nature': MappingProxyType({
         'figsize': (3.5, 2.5),
         'dpi': PUBLICATION_DPI,
         'format': 'svg',
-    },
-    'nature_double': {
+        'accepts_vector': True,
+    }),
+    'nature_double': MappingProxyType({
         'figsize': (7.0, 5.0),
         'dpi': PUBLICATION_DPI,
         'format': 'svg',
-    },
-    'plos': {
+        'accepts_vector': True,
+    }),
+    'plos': MappingProxyType({
         'figsize': (6.83, 5.0),
         'dpi': PUBLICATION_DPI,
         'format': 'tiff',
-    },
-    'bmj': {
+        'accepts_vector': True,
+    }),
+    'bmj': MappingProxyType({
         'figsize': (3.27, 2.5),
         'dpi': PUBLICATION_DPI,
         'format': 'eps',
-    },
-    'lancet': {
+        'accepts_vector': True,
+    }),
+    'lancet': MappingProxyType({
         'figsize': (3.27, 2.5),
         'dpi': PUBLICATION_DPI,
         'format': 'tiff',
-    },
+        'accepts_vector': True,
+    }),
 }
 
 
@@ -59,13 +101,13 @@ JOURNAL_PRESETS: Dict[str, Dict[str, Any]] = {
 # ============================================================================
 
 def add_oxford_branding(
-    fig: Figure,
+    fig: 'Figure',
     add_watermark: bool = False,
     watermark_text: str = "University of Oxford",
     position: Literal['bottom_right', 'bottom_left', 'top_right', 'top_left'] = 'bottom_right',
     opacity: float = 0.5,
     fontsize: int = 10,
-) -> Figure:
+) -> 'Figure':
     """
     Add Oxford University branding watermark to a figure.
 
@@ -163,12 +205,60 @@ def add_oxford_branding(
 # EXPORT FUNCTIONS
 # ============================================================================
 
+@contextlib.contextmanager
+def _rasterized_dense_collections(fig: 'Figure', threshold: Optional[int]) -> Iterator[None]:
+    """Temporarily rasterize collections with more than ``threshold`` elements."""
+    if threshold is None:
+        yield
+        return
+
+    import numpy as np
+
+    changed = []
+    for ax in fig.axes:
+        for collection in ax.collections:
+            n_offsets = np.asarray(collection.get_offsets()).shape[0]
+            n_elements = max(n_offsets, len(collection.get_paths()))
+            if n_elements > threshold and not collection.get_rasterized():
+                collection.set_rasterized(True)
+                changed.append(collection)
+    try:
+        yield
+    finally:
+        for collection in changed:
+            collection.set_rasterized(False)
+
+
+def _saved_file_mode(filename: str, tmp_filename: str) -> int:
+    """
+    Permission bits for a saved figure.
+
+    An existing file keeps its own mode; a new one gets the mode open() would
+    give it under the current umask. mkstemp() creates files readable by their
+    owner only, so the temporary file is chmod-ed to this before the move.
+    """
+    try:
+        return stat.S_IMODE(os.stat(filename).st_mode)
+    except FileNotFoundError:
+        pass
+    # Read the umask-applied mode off a throwaway file rather than calling
+    # os.umask(), which changes the umask process-wide
+    probe = f'{tmp_filename}.mode'
+    fd = os.open(probe, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        return stat.S_IMODE(os.fstat(fd).st_mode)
+    finally:
+        os.close(fd)
+        os.remove(probe)
+
+
 def save_oxford_figure(
-    fig: Figure,
+    fig: 'Figure',
     filename: str,
     format: str = 'png',
     dpi: int = 300,
-    bbox_inches: str = 'tight',
+    bbox_inches: Optional[str] = 'tight',
+    rasterize_dense: Optional[int] = None,
     **kwargs
 ) -> None:
     """
@@ -186,14 +276,25 @@ def save_oxford_figure(
         Output filename. Extension will be added if missing.
 
     format : str, default='png'
-        Output format: 'png', 'svg', 'pdf', 'eps', 'tiff', etc.
+        Output format: 'png', 'svg', 'pdf', 'eps', 'tiff', 'webp', etc.
 
     dpi : int, default=300
         Resolution in dots per inch. 300 is standard for publications.
         Use 600 for high-quality print or TIFF format.
 
-    bbox_inches : str, default='tight'
-        Bounding box setting. 'tight' removes excess whitespace.
+    bbox_inches : str or None, default='tight'
+        Bounding box setting. 'tight' removes excess whitespace at the cost of
+        an extra layout pass over every artist. Pass None when the figure
+        already uses constrained layout (``layout='constrained'``), which
+        has laid the figure out during draw.
+
+    rasterize_dense : int, optional
+        For vector formats, rasterize collections (scatter points, line
+        collections, meshes) with more than this many elements, embedding each
+        as a single image at ``dpi`` while text and axes stay vector. Shrinks
+        and speeds up PDF/SVG output of dense plots. The figure's own
+        rasterization settings are restored after saving. Ignored for raster
+        formats. Default None rasterizes nothing.
 
     **kwargs
         Additional arguments passed to fig.savefig()
@@ -216,6 +317,17 @@ def save_oxford_figure(
 
     >>> save_oxford_figure(fig, 'my_plot', format='svg')
 
+    Skip the tight bounding-box pass for a constrained-layout figure:
+
+    >>> fig, ax = oxford_figure(layout='constrained')
+    >>> save_oxford_figure(fig, 'my_plot.png', bbox_inches=None)
+
+    Vector PDF with a 100,000-point scatter embedded as an image:
+
+    >>> fig, ax = oxford_figure()
+    >>> ax.scatter(x, y, s=1)
+    >>> save_oxford_figure(fig, 'scatter.pdf', format='pdf', rasterize_dense=1000)
+
     High-resolution TIFF for journal submission:
 
     >>> save_oxford_figure(fig, 'figure1', format='tiff', dpi=600)
@@ -241,6 +353,25 @@ def save_oxford_figure(
 
     No browser or kaleido dependency required (unlike Plotly).
 
+    PNG output is encoded by Pillow through matplotlib's Agg canvas. Unless
+    ``pil_kwargs`` sets it, ``compress_level`` defaults to 3 rather than
+    Pillow's 6, which encodes about a quarter faster for somewhat larger
+    files; pass ``pil_kwargs={'compress_level': 9}`` for the smallest file.
+    The other avoidable cost is the extra draw that ``bbox_inches='tight'``
+    performs to measure the figure. With ``bbox_inches=None`` the figure is
+    drawn once and the image is exactly ``figsize * dpi`` pixels.
+
+    WebP is encoded by Pillow with ``method=0`` and ``quality=90`` unless
+    ``pil_kwargs`` overrides them. It gives files about half the size of PNG
+    at a similar speed, which suits web pages and slides; pass
+    ``pil_kwargs={'lossless': True}`` to avoid lossy artefacts.
+
+    The active backend is left alone: savefig renders through the canvas
+    for the requested format (Agg for raster output), even when pyplot uses
+    an interactive backend. For headless batch runs, set ``MPLBACKEND=Agg``
+    before matplotlib is imported rather than switching backends mid-script,
+    which would close any open figures.
+
     See Also
     --------
     add_oxford_branding : Add watermark to figure
@@ -250,26 +381,198 @@ def save_oxford_figure(
     if dpi <= 0:
         raise ValueError(f"dpi must be positive, got {dpi}")
 
-    if format.lower() not in SUPPORTED_FORMATS:
+    format_lower = format.lower()
+    if format_lower not in SUPPORTED_FORMATS:
         raise ValueError(
-            f"format '{format}' not recognized. Valid formats: {', '.join(sorted(SUPPORTED_FORMATS))}"
+            f"format '{format}' not recognized. Valid formats: {_AVAILABLE_FORMATS}"
         )
 
     # Add file extension if not present
-    if not filename.lower().endswith(f'.{format.lower()}'):
+    if os.path.splitext(filename)[1].lower() != _DOT_EXTENSIONS[format_lower]:
         filename = f'{filename}.{format}'
 
+    # Faster Pillow encoder settings, unless the caller chose their own
+    if format_lower in _PIL_KWARGS_DEFAULTS:
+        kwargs['pil_kwargs'] = {
+            **_PIL_KWARGS_DEFAULTS[format_lower], **(kwargs.get('pil_kwargs') or {})
+        }
+
     # Save figure with publication settings
-    fig.savefig(
-        filename,
-        format=format,
-        dpi=dpi,
-        bbox_inches=bbox_inches,
-        **kwargs
+    savefig_kwargs = dict(format=format, dpi=dpi, bbox_inches=bbox_inches, **kwargs)
+
+    if format_lower == 'pgf':
+        # backend_pgf writes raster images to files named after the output file,
+        # so it needs the real filename rather than an in-memory stream
+        with _rasterized_dense_collections(fig, rasterize_dense):
+            fig.savefig(filename, **savefig_kwargs)
+        return
+
+    # Write to a uniquely named temporary file next to the target and move it
+    # into place once complete, so readers never see a partial figure, a failed
+    # save leaves any existing file untouched and concurrent saves never collide
+    fd, tmp_filename = tempfile.mkstemp(
+        dir=os.path.dirname(filename) or '.', suffix=_DOT_EXTENSIONS[format_lower]
     )
+    try:
+        # Raster output can be large, so stream it through a 1 MiB buffer
+        with os.fdopen(fd, 'wb', buffering=_SAVE_BUFFER_SIZE) as file:
+            if format_lower in _STREAMED_VECTOR_FORMATS:
+                # Vector backends emit thousands of small writes; render the whole
+                # file into memory first so it reaches disk in a single write
+                buffer = io.BytesIO()
+                with _rasterized_dense_collections(fig, rasterize_dense):
+                    fig.savefig(buffer, **savefig_kwargs)
+                file.write(buffer.getbuffer())
+            else:
+                fig.savefig(file, **savefig_kwargs)
+        os.chmod(tmp_filename, _saved_file_mode(filename, tmp_filename))
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_filename)
+        raise
+
+
+def _init_save_worker() -> None:
+    """Select the non-interactive Agg backend in a save_oxford_figures() worker."""
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _save_pickled_figure(
+    fig_bytes: bytes,
+    filename: str,
+    format: str,
+    dpi: int,
+    bbox_inches: Optional[str],
+    kwargs: Dict[str, Any]
+) -> None:
+    """Unpickle a figure in a worker process and save it."""
+    fig = pickle.loads(fig_bytes)
+    try:
+        save_oxford_figure(fig, filename, format=format, dpi=dpi, bbox_inches=bbox_inches, **kwargs)
+    finally:
+        # Unpickling re-registers pyplot-managed figures with the worker's pyplot
+        import matplotlib.pyplot as plt
+        plt.close(fig)
+
+
+def save_oxford_figures(
+    figs: Sequence['Figure'],
+    filenames: Sequence[str],
+    format: str = 'png',
+    dpi: int = 300,
+    bbox_inches: Optional[str] = 'tight',
+    max_workers: Optional[int] = None,
+    **kwargs
+) -> None:
+    """
+    Save several figures in parallel worker processes.
+
+    Each figure is pickled and rendered by a ``ProcessPoolExecutor`` worker
+    with the same settings as :func:`save_oxford_figure`, so rasterization
+    and compression run on all CPU cores at once.
+
+    Parameters
+    ----------
+    figs : sequence of Figure
+        Matplotlib Figure objects to save
+
+    filenames : sequence of str
+        Output filenames, one per figure. Extensions are added if missing.
+
+    format : str, default='png'
+        Output format for every figure
+
+    dpi : int, default=300
+        Resolution in dots per inch
 
+    bbox_inches : str or None, default='tight'
+        Bounding box setting, as for :func:`save_oxford_figure`
 
-def get_journal_preset(journal_name: str) -> Dict[str, Any]:
+    max_workers : int, optional
+        Number of worker processes. Defaults to the number of CPUs, capped at
+        the number of figures. With a single worker the figures are saved in
+        this process, without pickling.
+
+    **kwargs
+        Additional arguments passed to fig.savefig()
+
+    Returns
+    -------
+    None
+        Saves files to disk
+
+    Raises
+    ------
+    ValueError
+        If figs and filenames differ in length, or if format or dpi is invalid
+
+    Examples
+    --------
+    >>> from oxford_matplotlib_theme import oxford_figure, save_oxford_figures
+    >>> figs = []
+    >>> for i in range(8):
+    ...     fig, ax = oxford_figure()
+    ...     ax.plot(range(10), [x ** i for x in range(10)])
+    ...     figs.append(fig)
+    >>> save_oxford_figures(figs, [f'figure_{i}' for i in range(8)], format='png')
+
+    Notes
+    -----
+    Figures must be picklable. Starting worker processes and pickling each
+    figure has a fixed cost, so parallel saving pays off for batches of
+    several figures with high-resolution raster output.
+
+    See Also
+    --------
+    save_oxford_figure : Save a single figure
+    """
+    if len(figs) != len(filenames):
+        raise ValueError(
+            f"figs and filenames must have the same length, got {len(figs)} and {len(filenames)}"
+        )
+
+    # Validate once up front rather than failing inside every worker
+    if dpi <= 0:
+        raise ValueError(f"dpi must be positive, got {dpi}")
+
+    if format.lower() not in SUPPORTED_FORMATS:
+        raise ValueError(
+            f"format '{format}' not recognized. Valid formats: {_AVAILABLE_FORMATS}"
+        )
+
+    if max_workers is None:
+        max_workers = min(len(figs), os.cpu_count() or 1)
+
+    if max_workers <= 1:
+        for fig, filename in zip(figs, filenames):
+            save_oxford_figure(
+                fig, filename, format=format, dpi=dpi, bbox_inches=bbox_inches, **kwargs
+            )
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_save_worker) as executor:
+        futures = [
+            executor.submit(
+                _save_pickled_figure,
+                pickle.dumps(fig),
+                filename,
+                format,
+                dpi,
+                bbox_inches,
+                kwargs
+            )
+            for fig, filename in zip(figs, filenames)
+        ]
+        # Re-raise the first worker error, if any
+        for future in futures:
+            future.result()
+
+
+def get_journal_preset(journal_name: str, prefer_vector: bool = False) -> Mapping[str, Any]:
     """
     Get figure size and export settings for specific journals.
 
@@ -286,13 +589,21 @@ def get_journal_preset(journal_name: str) -> Dict[str, Any]:
         - 'bmj': BMJ/British Medical Journal (3.27 x 2.5 in, EPS)
         - 'lancet': Lancet (3.27 x 2.5 in, TIFF)
 
+    prefer_vector : bool, default=False
+        If True and the journal accepts vector artwork, return 'pdf' in
+        place of a raster format such as TIFF. Vector output skips Agg
+        rasterization, so it saves much faster than a 300 dpi TIFF.
+
     Returns
     -------
-    dict
-        Configuration dictionary with keys:
+    Mapping
+        Read-only configuration mapping with keys:
         - 'figsize': Tuple[float, float] - Figure size in inches
         - 'dpi': int - Resolution
         - 'format': str - File format
+        - 'accepts_vector': bool - Whether the journal takes vector artwork
+
+        Use ``dict(preset)`` to get an editable copy.
 
     Raises
     ------
@@ -317,6 +628,11 @@ def get_journal_preset(journal_name: str) -> Dict[str, Any]:
     >>> ax.plot(x, y)
     >>> save_oxford_figure(fig, 'figure', format=preset['format'], dpi=preset['dpi'])
 
+    Vector output for a journal that defaults to TIFF:
+
+    >>> get_journal_preset('plos', prefer_vector=True)['format']
+    'pdf'
+
     Notes
     -----
     Journal requirements change over time. Always verify current submission
@@ -327,7 +643,7 @@ def get_journal_preset(journal_name: str) -> Dict[str, Any]:
     save_oxford_figure : Save figure with settings
     oxford_figure : Create figure with custom size
     """
-    journal_name_lower = journal_name.lower()
+    journal_name_lower = journal_name if journal_name in JOURNAL_PRESETS else journal_name.lower()
 
     if journal_name_lower not in JOURNAL_PRESETS:
         available = ', '.join(sorted(JOURNAL_PRESETS.keys()))
@@ -335,5 +651,14 @@ def get_journal_preset(journal_name: str) -> Dict[str, Any]:
             f"Journal '{journal_name}' not found. Available: {available}"
         )
 
-    # Return copy to prevent modification
-    return JOURNAL_PRESETS[journal_name_lower].copy()
+    # Presets are read-only views, so no defensive copy is needed
+    preset = JOURNAL_PRESETS[journal_name_lower]
+
+    if (
+        prefer_vector
+        and preset.get('accepts_vector', False)
+        and preset['format'] not in _VECTOR_FORMATS
+    ):
+        return MappingProxyType({**preset, 'format': 'pdf'})
+
+    return preset
@@ -0,0 +1,36 @@
+"""
+Shared pytest fixtures for the Oxford theme test suite
+"""
+
+import pytest
+import matplotlib.pyplot as plt
+from oxford_matplotlib_theme.styles import oxford_figure, reset_theme
+
+
+@pytest.fixture(scope='session')
+def rc_snapshot():
+    """Matplotlib's default rcParams, captured once per test session."""
+    reset_theme()
+    return dict(plt.rcParams)
+
+
+@pytest.fixture(autouse=True)
+def restore_rcparams(rc_snapshot):
+    """Restore the default rcParams after every test."""
+    yield
+    plt.rcParams.update(rc_snapshot)
+
+
+@pytest.fixture
+def make_oxford_figure():
+    """Factory for oxford_figure() that closes the figures it created."""
+    figures = []
+
+    def make(**kwargs):
+        fig, ax = oxford_figure(**kwargs)
+        figures.append(fig)
+        return fig, ax
+
+    yield make
+    for fig in figures:
+        plt.close(fig)
@@ -2,10 +2,13 @@
 Tests for Oxford color definitions and palettes
 """
 
+import re
+
 import pytest
 from oxford_matplotlib_theme.colors import (
     OxfordColors,
     OXFORD_COLORS,
+    OXFORD_COLORS_RGB,
     OXFORD_PALETTE,
     ColorPalettes,
     get_color,
@@ -13,15 +16,24 @@ from oxford_matplotlib_theme.colors import (
     get_color_palette,
 )
 
+# Six-digit #RRGGBB hex code, as used for every Oxford color
+HEX_RE = re.compile(r'#[0-9A-Fa-f]{6}')
+
 
 class TestOxfordColors:
     """Test the OxfordColors class attributes."""
 
     def test_oxford_colors_count(self):
         """Test that there are 56 Oxford colors."""
-        # Count class attributes (excluding special methods)
-        color_attrs = [attr for attr in dir(OxfordColors) if not attr.startswith('_') and attr.isupper()]
-        assert len(color_attrs) == 56, f"Should have exactly 56 Oxford colors, found {len(color_attrs)}"
+        n_colors = len(OXFORD_COLORS)
+        assert n_colors == 56, f"Should have exactly 56 Oxford colors, found {n_colors}"
+
+    def test_mapping_matches_public_constants(self):
+        """Test that OXFORD_COLORS holds every public constant and nothing else."""
+        public = {
+            name: value for name, value in vars(OxfordColors).items() if not name.startswith('_')
+        }
+        assert {name.upper(): value for name, value in OXFORD_COLORS.items()} == public
 
     def test_oxford_blue(self):
         """Test that Oxford Blue has the correct hex code."""
@@ -29,12 +41,9 @@ class TestOxfordColors:
 
     def test_colors_are_hex(self):
         """Test that all colors are valid hex codes."""
-        color_attrs = [attr for attr in dir(OxfordColors) if not attr.startswith('_')]
-        for attr_name in color_attrs:
-            color_value = getattr(OxfordColors, attr_name)
+        for attr_name, color_value in OXFORD_COLORS.items():
             assert isinstance(color_value, str), f"{attr_name} should be a string"
-            assert color_value.startswith('#'), f"{attr_name} should start with #"
-            assert len(color_value) == 7, f"{attr_name} should be 7 characters (#RRGGBB)"
+            assert HEX_RE.fullmatch(color_value), f"{attr_name}={color_value} should be #RRGGBB"
 
     def test_specific_colors(self):
         """Test that specific key colors are correct."""
@@ -56,8 +65,7 @@ class TestOxfordColors:
         for color in thesis_colors:
             assert hasattr(OxfordColors, color), f"Missing thesis color: {color}"
             color_value = getattr(OxfordColors, color)
-            assert color_value.startswith('#'), f"Invalid hex for {color}: {color_value}"
-            assert len(color_value) == 7, f"Invalid hex length for {color}: {color_value}"
+            assert HEX_RE.fullmatch(color_value), f"Invalid hex for {color}: {color_value}"
 
 
 class TestOxfordColorsDictionary:
@@ -77,8 +85,7 @@ class TestOxfordColorsDictionary:
         """Test that all dictionary values are valid hex codes."""
         for name, hex_code in OXFORD_COLORS.items():
             assert isinstance(hex_code, str), f"{name} value should be a string"
-            assert hex_code.startswith('#'), f"{name} value should start with #"
-            assert len(hex_code) == 7, f"{name} value should be 7 characters"
+            assert HEX_RE.fullmatch(hex_code), f"{name}={hex_code} should be #RRGGBB"
 
     def test_oxford_blue_in_dict(self):
         """Test that oxford_blue is in the dictionary."""
@@ -86,6 +93,26 @@ class TestOxfordColorsDictionary:
         assert OXFORD_COLORS['oxford_blue'] == '#002147'
 
 
+class TestOxfordColorsRGB:
+    """Test the pre-computed OXFORD_COLORS_RGB mapping."""
+
+    def test_same_keys_as_hex_dictionary(self):
+        """Test that every named color has an RGB entry."""
+        assert list(OXFORD_COLORS_RGB) == list(OXFORD_COLORS)
+
+    def test_rgb_matches_hex(self):
+        """Test that RGB tuples round-trip to the hex codes."""
+        for name, (r, g, b) in OXFORD_COLORS_RGB.items():
+            hex_code = '#{:02X}{:02X}{:02X}'.format(round(r * 255), round(g * 255), round(b * 255))
+            assert hex_code == OXFORD_COLORS[name], name
+
+    def test_rgb_values_in_unit_range(self):
+        """Test that all channels are floats in [0, 1]."""
+        for rgb in OXFORD_COLORS_RGB.values():
+            assert len(rgb) == 3
+            assert all(0.0 <= channel <= 1.0 for channel in rgb)
+
+
 class TestDefaultPalette:
     """Test the default OXFORD_PALETTE."""
 
@@ -104,8 +131,7 @@ class TestDefaultPalette:
     def test_palette_colors_valid_hex(self):
         """Test that all palette colors are valid hex codes."""
         for color in OXFORD_PALETTE:
-            assert color.startswith('#')
-            assert len(color) == 7
+            assert HEX_RE.fullmatch(color), color
 
 
 class TestColorPalettes:
@@ -159,8 +185,7 @@ class TestColorPalettes:
         for palette_name in palette_names:
             palette = getattr(ColorPalettes, palette_name)
             for color in palette:
-                assert color.startswith('#'), f"Color in {palette_name} should start with #"
-                assert len(color) == 7, f"Color in {palette_name} should be 7 characters"
+                assert HEX_RE.fullmatch(color), f"{palette_name} color {color} should be #RRGGBB"
 
 
 class TestGetColor:
@@ -174,11 +199,29 @@ class TestGetColor:
         """Test getting Coral by name."""
         assert get_color('coral') == '#FE615A'
 
+    def test_get_color_as_rgb(self):
+        """Test getting a color as an RGB tuple."""
+        assert get_color('oxford_blue', as_rgb=True) == (0.0, 33 / 255, 71 / 255)
+        assert get_color('Coral', as_rgb=True) == OXFORD_COLORS_RGB['coral']
+
     def test_invalid_color_raises_error(self):
         """Test that invalid color name raises ValueError."""
         with pytest.raises(ValueError):
             get_color('invalid_color_name')
 
+    def test_invalid_color_raises_on_every_call(self):
+        """Test that memoization does not swallow errors for unknown names."""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                get_color('invalid_color_name')
+
+    def test_get_color_is_cached(self):
+        """Test that repeated lookups are served from the cache."""
+        get_color.cache_clear()
+        get_color('aqua')
+        get_color('aqua')
+        assert get_color.cache_info().hits == 1
+
     def test_error_message_contains_available_colors(self):
         """Test that error message lists available colors."""
         try:
@@ -204,6 +247,12 @@ class TestGetPalette:
         palette3 = get_palette('Primary')
         assert palette1 == palette2 == palette3
 
+    def test_invalid_palette_error_uses_given_name(self):
+        """Test that the error names the palette as the caller spelled it."""
+        for as_rgb in (False, True):
+            with pytest.raises(ValueError, match="Palette 'Foo' not found"):
+                get_palette('Foo', as_rgb=as_rgb)
+
     def test_get_palette_with_n_colors(self):
         """Test getting specific number of colors from palette."""
         palette = get_palette('vibrant', n_colors=3)
@@ -223,14 +272,37 @@ class TestGetPalette:
         assert palette[6] == ColorPalettes.PROFESSIONAL[0]
         assert palette[7] == ColorPalettes.PROFESSIONAL[1]
 
-    def test_get_palette_returns_copy(self):
-        """Test that get_palette returns a copy, not the original."""
+    def test_get_palette_returns_immutable(self):
+        """Test that get_palette returns an immutable tuple."""
         palette = get_palette('primary')
-        original = ColorPalettes.PRIMARY
-        # Modify the returned palette
-        palette.append('#FFFFFF')
-        # Original should be unchanged
-        assert len(original) == 10
+        assert isinstance(palette, tuple)
+        assert palette == ColorPalettes.PRIMARY
+
+    def test_every_palette_is_available_by_name(self):
+        """Test that each ColorPalettes constant is returned by get_palette by name."""
+        for name, value in vars(ColorPalettes).items():
+            if name.isupper():
+                assert get_palette(name.lower()) == value, name
+
+    def test_palettes_are_tuples(self):
+        """Test that every ColorPalettes constant is an immutable tuple."""
+        for name, value in vars(ColorPalettes).items():
+            if name.isupper():
+                assert isinstance(value, tuple), name
+
+    def test_get_palette_is_cached(self):
+        """Test that repeated and equivalent calls share the cached tuple."""
+        assert get_palette('primary') is get_palette('primary')
+        assert get_palette('Primary') is get_palette('primary')
+        assert get_palette('primary') is get_palette('primary', n_colors=10)
+
+    def test_get_palette_as_rgb(self):
+        """Test that as_rgb returns RGB tuples matching the hex palette."""
+        hex_palette = get_palette('professional', n_colors=8)
+        rgb_palette = get_palette('professional', n_colors=8, as_rgb=True)
+        assert len(rgb_palette) == 8
+        for hex_code, rgb in zip(hex_palette, rgb_palette):
+            assert rgb == tuple(int(hex_code[i:i + 2], 16) / 255 for i in (1, 3, 5))
 
     def test_get_all_palettes(self):
         """Test getting all palette types."""
@@ -242,9 +314,9 @@ class TestGetPalette:
         ]
         for name in palette_names:
             palette = get_palette(name)
-            assert isinstance(palette, list)
+            assert isinstance(palette, tuple)
             assert len(palette) > 0
-            assert all(color.startswith('#') for color in palette)
+            assert all(HEX_RE.fullmatch(color) for color in palette)
 
     def test_get_phc_thesis_palette(self):
         """Test getting PHC_THESIS palette specifically."""
@@ -3,12 +3,16 @@ Tests for Oxford theme export and branding utilities
 """
 
 import pytest
+import numpy as np
 import matplotlib.pyplot as plt
 import os
+import stat
 import tempfile
+from collections.abc import Mapping
 from oxford_matplotlib_theme.utils import (
     add_oxford_branding,
     save_oxford_figure,
+    save_oxford_figures,
     get_journal_preset,
     JOURNAL_PRESETS,
 )
@@ -113,7 +117,8 @@ class TestSaveOxfordFigure:
         """Create test figure and temporary directory."""
         plt.close('all')
         reset_theme()
-        self.fig, self.ax = oxford_figure()
+        # Journal single-column size keeps each 300 dpi save cheap
+        self.fig, self.ax = oxford_figure(figsize=(3.5, 2.5))
         self.ax.plot([1, 2, 3], [1, 4, 9])
         self.ax.set_title('Test Plot')
 
@@ -154,6 +159,16 @@ class TestSaveOxfordFigure:
         assert os.path.exists(filename)
         assert os.path.getsize(filename) > 0
 
+    def test_saves_webp_file(self):
+        """Test saving as WebP."""
+        from PIL import Image
+
+        filename = os.path.join(self.temp_dir, 'test.webp')
+        save_oxford_figure(self.fig, filename, format='webp', dpi=100)
+
+        with Image.open(filename) as img:
+            assert img.format == 'WEBP'
+
     def test_adds_extension_if_missing(self):
         """Test that file extension is added if missing."""
         filename = os.path.join(self.temp_dir, 'test')  # No extension
@@ -193,6 +208,17 @@ class TestSaveOxfordFigure:
 
         assert os.path.exists(filename)
 
+    def test_bbox_inches_none_keeps_figure_size(self):
+        """Test that bbox_inches=None saves the full figure at figsize * dpi."""
+        from PIL import Image
+
+        filename = os.path.join(self.temp_dir, 'test_full.png')
+        save_oxford_figure(self.fig, filename, dpi=100, bbox_inches=None)
+
+        width, height = self.fig.get_size_inches() * 100
+        with Image.open(filename) as img:
+            assert img.size == (round(width), round(height))
+
     def test_additional_kwargs_passed(self):
         """Test that additional kwargs are passed to savefig."""
         filename = os.path.join(self.temp_dir, 'test_kwargs.png')
@@ -201,6 +227,159 @@ class TestSaveOxfordFigure:
 
         assert os.path.exists(filename)
 
+    def test_png_compress_level_can_be_overridden(self):
+        """Test that pil_kwargs compress_level replaces the fast PNG default."""
+        fast = os.path.join(self.temp_dir, 'test_fast.png')
+        small = os.path.join(self.temp_dir, 'test_small.png')
+        save_oxford_figure(self.fig, fast)
+        save_oxford_figure(self.fig, small, pil_kwargs={'compress_level': 9})
+
+        assert os.path.getsize(small) < os.path.getsize(fast)
+
+    def test_rasterize_dense_shrinks_vector_output(self):
+        """Test that dense collections are embedded as images in vector output."""
+        rng = np.random.default_rng(0)
+        scatter = self.ax.scatter(rng.random(5000), rng.random(5000), s=1)
+        vector = os.path.join(self.temp_dir, 'test_vector.pdf')
+        rasterized = os.path.join(self.temp_dir, 'test_rasterized.pdf')
+        save_oxford_figure(self.fig, vector, format='pdf')
+        save_oxford_figure(self.fig, rasterized, format='pdf', rasterize_dense=1000)
+
+        assert os.path.getsize(rasterized) < os.path.getsize(vector)
+        # The figure's own rasterization setting is restored
+        assert not scatter.get_rasterized()
+
+    def test_rasterize_dense_skips_sparse_collections(self):
+        """Test that collections below the threshold stay vector."""
+        self.ax.scatter([1, 2, 3], [1, 4, 9])
+        threshold = os.path.join(self.temp_dir, 'test_threshold.svg')
+        save_oxford_figure(self.fig, threshold, format='svg', rasterize_dense=1000)
+
+        with open(threshold, 'rb') as f:
+            assert b'<image' not in f.read()
+
+    def test_pgf_is_saved_by_filename(self, monkeypatch):
+        """Test that PGF output goes to the target path rather than a stream."""
+        targets = []
+        monkeypatch.setattr(self.fig, 'savefig', lambda fname, **kwargs: targets.append(fname))
+        filename = os.path.join(self.temp_dir, 'test.pgf')
+        save_oxford_figure(self.fig, filename, format='pgf')
+
+        assert targets == [filename]
+
+    def test_failed_save_leaves_no_file(self):
+        """Test that no empty or temporary file is left behind when savefig raises."""
+        filename = os.path.join(self.temp_dir, 'test_failed.png')
+
+        with pytest.raises(TypeError):
+            save_oxford_figure(self.fig, filename, not_a_savefig_option=True)
+
+        assert os.listdir(self.temp_dir) == []
+
+    def test_save_leaves_similar_temp_names_alone(self):
+        """Test that saving never reuses or removes a file named like a fixed temp file."""
+        filename = os.path.join(self.temp_dir, 'test_temp.png')
+        with open(f'{filename}.tmp', 'wb') as f:
+            f.write(b'unrelated')
+        save_oxford_figure(self.fig, filename, dpi=100)
+
+        with open(f'{filename}.tmp', 'rb') as f:
+            assert f.read() == b'unrelated'
+        assert sorted(os.listdir(self.temp_dir)) == ['test_temp.png', 'test_temp.png.tmp']
+
+    @pytest.mark.skipif(os.name != 'posix', reason='POSIX permission bits')
+    def test_saved_file_has_default_permissions(self):
+        """Test that the saved file gets the same mode as a file created by open()."""
+        reference = os.path.join(self.temp_dir, 'reference')
+        open(reference, 'wb').close()
+        filename = os.path.join(self.temp_dir, 'test_mode.png')
+        save_oxford_figure(self.fig, filename, dpi=100)
+
+        assert os.stat(filename).st_mode == os.stat(reference).st_mode
+
+    @pytest.mark.skipif(os.name != 'posix', reason='POSIX permission bits')
+    def test_overwrite_keeps_existing_permissions(self):
+        """Test that overwriting a file keeps that file's mode."""
+        filename = os.path.join(self.temp_dir, 'test_mode.png')
+        save_oxford_figure(self.fig, filename, dpi=100)
+        os.chmod(filename, 0o640)
+        save_oxford_figure(self.fig, filename, dpi=100)
+
+        assert stat.S_IMODE(os.stat(filename).st_mode) == 0o640
+
+    @pytest.mark.parametrize('format', ['png', 'svg'])
+    def test_failed_save_keeps_existing_file(self, format):
+        """Test that a failed render leaves an existing file untouched."""
+        filename = os.path.join(self.temp_dir, f'test_existing.{format}')
+        save_oxford_figure(self.fig, filename, format=format)
+        with open(filename, 'rb') as f:
+            original = f.read()
+
+        with pytest.raises(TypeError):
+            save_oxford_figure(self.fig, filename, format=format, not_a_savefig_option=True)
+
+        with open(filename, 'rb') as f:
+            assert f.read() == original
+        assert os.listdir(self.temp_dir) == [f'test_existing.{format}']
+
+
+class TestSaveOxfordFigures:
+    """Test the save_oxford_figures batch function."""
+
+    def setup_method(self):
+        """Create test figures and temporary directory."""
+        plt.close('all')
+        reset_theme()
+        self.figs = []
+        for i in range(3):
+            fig, ax = oxford_figure(figsize=(3.5, 2.5))
+            ax.plot([1, 2, 3], [1, 4, 9 + i])
+            self.figs.append(fig)
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.filenames = [os.path.join(self.temp_dir, f'test_{i}') for i in range(3)]
+
+    def teardown_method(self):
+        """Clean up test files and figures."""
+        plt.close('all')
+        reset_theme()
+
+        import shutil
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_saves_all_figures_in_parallel(self):
+        """Test that worker processes save one file per figure."""
+        save_oxford_figures(self.figs, self.filenames, dpi=100, max_workers=2)
+
+        for filename in self.filenames:
+            assert os.path.getsize(filename + '.png') > 0
+
+    def test_parallel_output_matches_serial(self):
+        """Test that worker processes produce the same image as saving in-process."""
+        from PIL import Image
+
+        serial = [name + '_serial' for name in self.filenames]
+        save_oxford_figures(self.figs, self.filenames, dpi=100, max_workers=2)
+        save_oxford_figures(self.figs, serial, dpi=100, max_workers=1)
+
+        for parallel_name, serial_name in zip(self.filenames, serial):
+            with Image.open(parallel_name + '.png') as a, Image.open(serial_name + '.png') as b:
+                assert a.size == b.size
+                assert a.tobytes() == b.tobytes()
+
+    def test_length_mismatch_raises_error(self):
+        """Test that figs and filenames must have the same length."""
+        with pytest.raises(ValueError, match='same length'):
+            save_oxford_figures(self.figs, self.filenames[:2])
+
+    def test_invalid_format_raises_before_saving(self):
+        """Test that an invalid format is rejected before any file is written."""
+        with pytest.raises(ValueError, match='not recognized'):
+            save_oxford_figures(self.figs, self.filenames, format='invalid')
+
+        assert os.listdir(self.temp_dir) == []
+
 
 class TestJournalPresets:
     """Test journal preset configurations."""
@@ -261,10 +440,10 @@ class TestJournalPresets:
 class TestGetJournalPreset:
     """Test the get_journal_preset function."""
 
-    def test_returns_dict(self):
-        """Test that function returns a dictionary."""
+    def test_returns_mapping(self):
+        """Test that function returns a mapping."""
         preset = get_journal_preset('nature')
-        assert isinstance(preset, dict)
+        assert isinstance(preset, Mapping)
 
     def test_returns_correct_preset(self):
         """Test that correct preset is returned."""
@@ -283,7 +462,7 @@ class TestGetJournalPreset:
         """Test that all journals can be accessed."""
         for journal_name in JOURNAL_PRESETS.keys():
             preset = get_journal_preset(journal_name)
-            assert isinstance(preset, dict)
+            assert isinstance(preset, Mapping)
             assert 'figsize' in preset
 
     def test_invalid_journal_raises_error(self):
@@ -299,14 +478,33 @@ class TestGetJournalPreset:
             error_msg = str(e).lower()
             assert 'nature' in error_msg
 
-    def test_returns_copy_not_original(self):
-        """Test that function returns a copy, not the original."""
+    def test_returned_preset_is_read_only(self):
+        """Test that the returned preset cannot be modified."""
         preset = get_journal_preset('nature')
 
-        # Modify the returned preset
+        with pytest.raises(TypeError):
+            preset['dpi'] = 999
+
+        assert JOURNAL_PRESETS['nature']['dpi'] != 999
+
+    def test_prefer_vector_switches_raster_format(self):
+        """Test that prefer_vector returns PDF for TIFF journals accepting vectors."""
+        preset = get_journal_preset('plos', prefer_vector=True)
+
+        assert preset['format'] == 'pdf'
+        assert preset['figsize'] == JOURNAL_PRESETS['plos']['figsize']
+        assert JOURNAL_PRESETS['plos']['format'] == 'tiff'
+
+    def test_prefer_vector_keeps_vector_format(self):
+        """Test that prefer_vector leaves SVG and EPS presets unchanged."""
+        assert get_journal_preset('nature', prefer_vector=True)['format'] == 'svg'
+        assert get_journal_preset('bmj', prefer_vector=True)['format'] == 'eps'
+
+    def test_dict_copy_is_editable(self):
+        """Test that dict(preset) gives an independent, editable copy."""
+        preset = dict(get_journal_preset('nature'))
         preset['dpi'] = 999
 
-        # Original should be unchanged
         assert JOURNAL_PRESETS['nature']['dpi'] != 999
 
 
@@ -0,0 +1,87 @@
+"""
+Tests for the top-level package namespace
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+import oxford_matplotlib_theme
+
+
+class TestLazyImports:
+    """Test that matplotlib-dependent names are loaded on demand."""
+
+    def test_import_does_not_load_matplotlib(self):
+        """Test that importing the package and reading colors skips matplotlib."""
+        code = (
+            "import sys\n"
+            "import oxford_matplotlib_theme\n"
+            "assert oxford_matplotlib_theme.OXFORD_COLORS['coral'] == '#FE615A'\n"
+            "assert 'matplotlib' not in sys.modules, 'matplotlib was imported eagerly'\n"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, cwd=repo_root
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_colors_only_does_not_load_matplotlib(self):
+        """Test that the colors_only entry point never imports matplotlib."""
+        code = (
+            "import sys\n"
+            "from oxford_matplotlib_theme.colors_only import OXFORD_COLORS, get_palette\n"
+            "assert OXFORD_COLORS['oxford_blue'] == '#002147'\n"
+            "assert get_palette('primary', n_colors=1) == ('#002147',)\n"
+            "assert 'matplotlib' not in sys.modules, 'matplotlib was imported'\n"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, cwd=repo_root
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_journal_presets_do_not_load_matplotlib(self):
+        """Test that reading journal presets never imports matplotlib."""
+        code = (
+            "import sys\n"
+            "from oxford_matplotlib_theme import get_journal_preset\n"
+            "assert get_journal_preset('nature')['format'] == 'svg'\n"
+            "assert 'matplotlib' not in sys.modules, 'matplotlib was imported'\n"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, cwd=repo_root
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_colors_only_matches_package(self):
+        """Test that colors_only re-exports the same objects as the package."""
+        from oxford_matplotlib_theme import colors_only
+        for name in colors_only.__all__:
+            assert getattr(colors_only, name) is getattr(oxford_matplotlib_theme, name), name
+
+    def test_all_public_names_resolve(self):
+        """Test that every name in __all__ is accessible from the package."""
+        for name in oxford_matplotlib_theme.__all__:
+            assert getattr(oxford_matplotlib_theme, name) is not None, name
+
+    def test_lazy_names_match_submodules(self):
+        """Test that lazily loaded names are the submodule objects themselves."""
+        from oxford_matplotlib_theme import styles, utils
+        assert oxford_matplotlib_theme.apply_oxford_theme is styles.apply_oxford_theme
+        assert oxford_matplotlib_theme.save_oxford_figure is utils.save_oxford_figure
+
+    def test_dir_lists_public_api(self):
+        """Test that dir() includes lazily loaded names."""
+        assert set(oxford_matplotlib_theme.__all__) <= set(dir(oxford_matplotlib_theme))
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            oxford_matplotlib_theme.not_a_real_name
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
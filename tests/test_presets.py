@@ -9,6 +9,7 @@ from oxford_matplotlib_theme.presets import (
     apply_preset,
     list_presets,
     get_preset_config,
+    get_preset_descriptions,
 )
 from oxford_matplotlib_theme.styles import reset_theme
 from oxford_matplotlib_theme.colors import OXFORD_COLORS
@@ -64,14 +65,6 @@ class TestPresetDefinitions:
 class TestApplyPreset:
     """Test the apply_preset function."""
 
-    def setup_method(self):
-        """Reset theme before each test."""
-        reset_theme()
-
-    def teardown_method(self):
-        """Reset theme after each test."""
-        reset_theme()
-
     def test_apply_default_preset(self):
         """Test applying default preset."""
         apply_preset('default')
@@ -82,13 +75,12 @@ class TestApplyPreset:
         apply_preset('presentation')
         assert plt.rcParams['axes.labelcolor'] == OXFORD_COLORS['oxford_blue']
 
-    def test_apply_all_presets(self):
-        """Test that all presets can be applied without error."""
-        for preset_name in PRESETS.keys():
-            reset_theme()
-            apply_preset(preset_name)
-            # Should have Oxford Blue in axes
-            assert plt.rcParams['axes.labelcolor'] == OXFORD_COLORS['oxford_blue']
+    @pytest.mark.parametrize('preset_name', sorted(PRESETS))
+    def test_apply_all_presets(self, preset_name):
+        """Test that every preset can be applied without error."""
+        apply_preset(preset_name)
+        # Should have Oxford Blue in axes
+        assert plt.rcParams['axes.labelcolor'] == OXFORD_COLORS['oxford_blue']
 
     def test_presentation_increases_font_size(self):
         """Test that presentation preset increases font size."""
@@ -116,6 +108,33 @@ class TestApplyPreset:
         # Poster should have much larger fonts
         assert poster_font_size > default_font_size * 1.5
 
+    def test_preset_color_cycle_applied(self):
+        """Test that a preset's named color cycle is applied as hex codes."""
+        apply_preset('colorblind')
+        cycle_colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+        expected = [OXFORD_COLORS[name] for name in PRESETS['colorblind']['color_cycle']]
+        assert cycle_colors == expected
+
+    def test_preset_added_at_runtime(self):
+        """Test that presets added to or edited in PRESETS are honoured."""
+        PRESETS['custom'] = {
+            'description': 'Custom',
+            'style_base': 'seaborn-v0_8-paper',
+            'color_cycle': ['coral'],
+            'font_scale': 1.0,
+        }
+        try:
+            apply_preset('custom')
+            assert plt.rcParams['axes.prop_cycle'].by_key()['color'] == [OXFORD_COLORS['coral']]
+
+            PRESETS['custom']['color_cycle'].append('aqua')
+            apply_preset('custom')
+            assert plt.rcParams['axes.prop_cycle'].by_key()['color'] == [
+                OXFORD_COLORS['coral'], OXFORD_COLORS['aqua']
+            ]
+        finally:
+            del PRESETS['custom']
+
     def test_case_insensitive_preset_names(self):
         """Test that preset names are case-insensitive."""
         # These should all work
@@ -165,25 +184,15 @@ class TestListPresets:
         captured = capsys.readouterr()
         assert len(captured.out) > 0
 
-    def test_list_presets_shows_preset_names(self, capsys):
-        """Test that list_presets displays preset names."""
-        list_presets()
-        captured = capsys.readouterr()
-        output = captured.out.lower()
-
-        # Should show some preset names
-        assert 'default' in output
-        assert 'presentation' in output
-
-    def test_list_presets_shows_descriptions(self, capsys):
-        """Test that list_presets displays descriptions."""
-        list_presets()
-        captured = capsys.readouterr()
-        output = captured.out
+    def test_preset_descriptions_list_every_preset(self):
+        """Test that get_preset_descriptions lists every preset name."""
+        names = [name for name, _ in get_preset_descriptions()]
+        assert names == sorted(PRESETS)
 
-        # Should show description content
-        assert 'academic' in output.lower() or 'paper' in output.lower()
-        assert 'presentation' in output.lower() or 'slide' in output.lower()
+    def test_preset_descriptions_match_configs(self):
+        """Test that get_preset_descriptions pairs each name with its description."""
+        for name, description in get_preset_descriptions():
+            assert description == PRESETS[name]['description']
 
     def test_list_presets_formatted_nicely(self, capsys):
         """Test that output is formatted with separators."""
@@ -210,12 +219,12 @@ class TestGetPresetConfig:
         for key in required_keys:
             assert key in config
 
-    def test_get_all_preset_configs(self):
-        """Test getting config for all presets."""
-        for preset_name in PRESETS.keys():
-            config = get_preset_config(preset_name)
-            assert isinstance(config, dict)
-            assert 'description' in config
+    @pytest.mark.parametrize('preset_name', sorted(PRESETS))
+    def test_get_all_preset_configs(self, preset_name):
+        """Test getting config for every preset."""
+        config = get_preset_config(preset_name)
+        assert isinstance(config, dict)
+        assert 'description' in config
 
     def test_case_insensitive(self):
         """Test that preset name is case-insensitive."""
@@ -3,12 +3,14 @@ Tests for Oxford theme styling functions
 """
 
 import pytest
+from cycler import cycler
 import matplotlib.pyplot as plt
 from oxford_matplotlib_theme.styles import (
     apply_oxford_theme,
     reset_theme,
-    oxford_figure,
     get_oxford_rcparams,
+    get_oxford_cycler,
+    get_oxford_cmap,
 )
 from oxford_matplotlib_theme.colors import OXFORD_COLORS, OXFORD_PALETTE
 
@@ -16,14 +18,6 @@ from oxford_matplotlib_theme.colors import OXFORD_COLORS, OXFORD_PALETTE
 class TestApplyOxfordTheme:
     """Test the apply_oxford_theme function."""
 
-    def setup_method(self):
-        """Reset theme before each test."""
-        reset_theme()
-
-    def teardown_method(self):
-        """Reset theme after each test."""
-        reset_theme()
-
     def test_theme_applies_without_error(self):
         """Test that theme applies successfully."""
         apply_oxford_theme()
@@ -82,15 +76,15 @@ class TestApplyOxfordTheme:
         """Test that color cycle uses OXFORD_PALETTE."""
         apply_oxford_theme()
         prop_cycle = plt.rcParams['axes.prop_cycle']
-        colors = [c['color'] for c in prop_cycle]
-        assert colors == OXFORD_PALETTE
+        colors = prop_cycle.by_key()['color']
+        assert tuple(colors) == OXFORD_PALETTE
 
     def test_custom_color_cycle_hex(self):
         """Test applying theme with custom color cycle (hex codes)."""
         custom_colors = ['#FF0000', '#00FF00', '#0000FF']
         apply_oxford_theme(color_cycle=custom_colors)
         prop_cycle = plt.rcParams['axes.prop_cycle']
-        colors = [c['color'] for c in prop_cycle]
+        colors = prop_cycle.by_key()['color']
         assert colors == custom_colors
 
     def test_custom_color_cycle_names(self):
@@ -98,10 +92,35 @@ class TestApplyOxfordTheme:
         custom_names = ['oxford_blue', 'coral', 'aqua']
         apply_oxford_theme(color_cycle=custom_names)
         prop_cycle = plt.rcParams['axes.prop_cycle']
-        colors = [c['color'] for c in prop_cycle]
+        colors = prop_cycle.by_key()['color']
         expected = [OXFORD_COLORS[name] for name in custom_names]
         assert colors == expected
 
+    def test_custom_color_cycle_mixed_case_names(self):
+        """Test that color names in a custom cycle are case-insensitive."""
+        apply_oxford_theme(color_cycle=['Coral', '#123456'])
+        colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+        assert colors == [OXFORD_COLORS['coral'], '#123456']
+
+    def test_malformed_hex_code_raises(self):
+        """Test that malformed hex codes are rejected before anything is applied."""
+        with pytest.raises(ValueError, match='#12345'):
+            apply_oxford_theme(color_cycle=['#002147', '#12345'])
+
+    def test_short_and_alpha_hex_codes_accepted(self):
+        """Test that #rgb and #rrggbbaa hex codes are accepted."""
+        apply_oxford_theme(color_cycle=['#fff', '#002147CC'])
+        colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+        assert colors == ['#fff', '#002147CC']
+
+    def test_invalid_color_names_reported_together(self):
+        """Test that every unknown color name is listed in one error."""
+        original_cycle = plt.rcParams['axes.prop_cycle']
+        with pytest.raises(ValueError, match='also_bad, not_a_color'):
+            apply_oxford_theme(color_cycle=['coral', 'not_a_color', 'also_bad'])
+        # Nothing is applied when validation fails
+        assert plt.rcParams['axes.prop_cycle'] == original_cycle
+
     def test_font_scale_increases_font_sizes(self):
         """Test that font_scale increases font sizes."""
         # Get base font size
@@ -128,18 +147,49 @@ class TestApplyOxfordTheme:
         assert plt.rcParams['axes.labelsize'] == pytest.approx(base_label_size * 2.0, rel=0.01)
         assert plt.rcParams['axes.titlesize'] == pytest.approx(base_title_size * 2.0, rel=0.01)
 
-    def test_different_base_styles(self):
+    @pytest.mark.parametrize('style', [
+        'seaborn-v0_8-paper',
+        'seaborn-v0_8-notebook',
+        'seaborn-v0_8-whitegrid',
+    ])
+    def test_different_base_styles(self, style):
         """Test applying theme with different base styles."""
-        base_styles = [
-            'seaborn-v0_8-paper',
-            'seaborn-v0_8-notebook',
-            'seaborn-v0_8-whitegrid',
-        ]
-        for style in base_styles:
-            reset_theme()
-            apply_oxford_theme(style_base=style)
-            # Should still have Oxford Blue in axes
-            assert plt.rcParams['axes.labelcolor'] == OXFORD_COLORS['oxford_blue']
+        apply_oxford_theme(style_base=style)
+        # Should still have Oxford Blue in axes
+        assert plt.rcParams['axes.labelcolor'] == OXFORD_COLORS['oxford_blue']
+
+    def test_reapply_skips_style_use(self, monkeypatch):
+        """Test that re-applying with the same style does not reload it."""
+        apply_oxford_theme()
+
+        calls = []
+        monkeypatch.setattr(plt.style, 'use', calls.append)
+        apply_oxford_theme()
+        assert calls == []
+
+    def test_reapply_identical_call_is_idempotent(self):
+        """Test that repeating a call with the same arguments leaves rcParams unchanged."""
+        apply_oxford_theme(font_scale=1.4)
+        first = dict(plt.rcParams)
+        apply_oxford_theme(font_scale=1.4)
+        assert plt.rcParams['font.size'] == first['font.size']
+        assert plt.rcParams['axes.labelsize'] == first['axes.labelsize']
+
+    def test_reapply_restores_modified_theme_params(self):
+        """Test that re-applying restores theme values changed since the last call."""
+        apply_oxford_theme()
+        plt.rcParams['axes.labelcolor'] = 'red'
+        apply_oxford_theme()
+        assert plt.rcParams['axes.labelcolor'] == OXFORD_COLORS['oxford_blue']
+
+    def test_reapply_restores_modified_style_params(self):
+        """Test that re-applying restores style values changed since the last call."""
+        apply_oxford_theme()
+        expected = plt.rcParams['lines.linewidth']
+
+        plt.rcParams['lines.linewidth'] = expected + 5
+        apply_oxford_theme()
+        assert plt.rcParams['lines.linewidth'] == expected
 
 
 class TestResetTheme:
@@ -161,11 +211,8 @@ class TestResetTheme:
     def test_reset_multiple_params(self):
         """Test that reset affects multiple parameters."""
         # Get defaults
-        defaults = {
-            'axes.labelcolor': plt.rcParamsDefault['axes.labelcolor'],
-            'text.color': plt.rcParamsDefault['text.color'],
-            'legend.edgecolor': plt.rcParamsDefault['legend.edgecolor'],
-        }
+        params = ('axes.labelcolor', 'text.color', 'legend.edgecolor')
+        defaults = {param: plt.rcParamsDefault[param] for param in params}
 
         # Apply theme
         apply_oxford_theme()
@@ -174,91 +221,104 @@ class TestResetTheme:
         reset_theme()
 
         # Check all are restored
-        for param, default_value in defaults.items():
-            assert plt.rcParams[param] == default_value
+        assert {param: plt.rcParams[param] for param in params} == defaults
 
 
 class TestOxfordFigure:
     """Test the oxford_figure function."""
 
-    def setup_method(self):
-        """Clean up before each test."""
-        plt.close('all')
-        reset_theme()
-
-    def teardown_method(self):
-        """Clean up after each test."""
-        plt.close('all')
-        reset_theme()
-
-    def test_returns_figure_and_axes(self):
+    def test_returns_figure_and_axes(self, make_oxford_figure):
         """Test that oxford_figure returns fig and ax."""
-        fig, ax = oxford_figure()
+        fig, ax = make_oxford_figure()
         assert fig is not None
         assert ax is not None
 
-    def test_returned_types(self):
+    def test_returned_types(self, make_oxford_figure):
         """Test that returned objects are correct types."""
         from matplotlib.figure import Figure
         from matplotlib.axes import Axes
 
-        fig, ax = oxford_figure()
+        fig, ax = make_oxford_figure()
         assert isinstance(fig, Figure)
         assert isinstance(ax, Axes)
 
-    def test_applies_oxford_theme(self):
+    def test_applies_oxford_theme(self, make_oxford_figure):
         """Test that oxford_figure applies Oxford theme."""
-        fig, ax = oxford_figure()
+        fig, ax = make_oxford_figure()
         assert plt.rcParams['axes.labelcolor'] == OXFORD_COLORS['oxford_blue']
 
-    def test_custom_figsize(self):
+    def test_custom_figsize(self, make_oxford_figure):
         """Test creating figure with custom size."""
-        fig, ax = oxford_figure(figsize=(8, 6))
+        fig, ax = make_oxford_figure(figsize=(8, 6))
         # Get figure size in inches
         size = fig.get_size_inches()
         assert size[0] == pytest.approx(8, rel=0.01)
         assert size[1] == pytest.approx(6, rel=0.01)
 
-    def test_default_figsize(self):
+    def test_default_figsize(self, make_oxford_figure):
         """Test that default figsize is (10, 6)."""
-        fig, ax = oxford_figure()
+        fig, ax = make_oxford_figure()
         size = fig.get_size_inches()
         assert size[0] == pytest.approx(10, rel=0.01)
         assert size[1] == pytest.approx(6, rel=0.01)
 
-    def test_custom_color_cycle(self):
+    def test_custom_color_cycle(self, make_oxford_figure):
         """Test oxford_figure with custom color cycle."""
         custom_colors = ['coral', 'aqua', 'oxford_blue']
-        fig, ax = oxford_figure(color_cycle=custom_colors)
+        fig, ax = make_oxford_figure(color_cycle=custom_colors)
         prop_cycle = plt.rcParams['axes.prop_cycle']
-        colors = [c['color'] for c in prop_cycle]
+        colors = prop_cycle.by_key()['color']
         expected = [OXFORD_COLORS[name] for name in custom_colors]
         assert colors == expected
 
-    def test_font_scale_parameter(self):
+    def test_font_scale_parameter(self, make_oxford_figure):
         """Test oxford_figure with font scaling."""
-        fig, ax = oxford_figure(font_scale=1.5)
+        fig, ax = make_oxford_figure(font_scale=1.5)
         # Font size should be scaled
         # We can't easily check the exact value, but ensure it's applied
         assert plt.rcParams['axes.labelcolor'] == OXFORD_COLORS['oxford_blue']
 
-    def test_kwargs_passed_to_subplots(self):
+    def test_kwargs_passed_to_subplots(self, make_oxford_figure):
         """Test that additional kwargs are passed to plt.subplots."""
         # Use constrained_layout instead of dpi, as dpi can be overridden by style
-        fig, ax = oxford_figure(layout='constrained')
+        fig, ax = make_oxford_figure(layout='constrained')
         assert fig.get_layout_engine() is not None
 
 
-class TestGetOxfordRcParams:
-    """Test the get_oxford_rcparams function."""
+class TestCachedThemeObjects:
+    """Test the cached default cycler and colormap."""
 
-    def setup_method(self):
-        """Reset theme before each test."""
-        reset_theme()
+    def test_cycler_matches_palette(self):
+        """Test that the cycler yields the OXFORD_PALETTE colors."""
+        assert tuple(get_oxford_cycler().by_key()['color']) == OXFORD_PALETTE
+
+    def test_cycler_mutation_does_not_leak(self):
+        """Test that modifying a returned cycler leaves later calls unchanged."""
+        cyc = get_oxford_cycler()
+        cyc *= cycler(linestyle=['-', '--'])
+        assert get_oxford_cycler().keys == {'color'}
+        assert len(get_oxford_cycler()) == len(OXFORD_PALETTE)
 
-    def teardown_method(self):
-        """Reset theme after each test."""
+    def test_custom_cycle_mutation_does_not_leak(self):
+        """Test that modifying an applied custom cycler leaves the next apply unchanged."""
+        apply_oxford_theme(color_cycle=['coral', '#00AAB4'])
+        cyc = plt.rcParams['axes.prop_cycle']
+        cyc *= cycler(linestyle=['-', '--'])
         reset_theme()
+        apply_oxford_theme(color_cycle=['coral', '#00AAB4'])
+        assert plt.rcParams['axes.prop_cycle'].keys == {'color'}
+        reset_theme()
+
+    def test_cmap_matches_palette(self):
+        """Test that the colormap has one entry per palette color."""
+        cmap = get_oxford_cmap()
+        assert cmap.name == 'oxford'
+        assert cmap.N == len(OXFORD_PALETTE)
+        assert get_oxford_cmap() is cmap
+
+
+class TestGetOxfordRcParams:
+    """Test the get_oxford_rcparams function."""
 
     def test_returns_dict(self):
         """Test that function returns a dictionary."""
@@ -291,15 +351,51 @@ class TestGetOxfordRcParams:
         # Font size should be doubled
         assert params2['font.size'] == pytest.approx(params1['font.size'] * 2.0, rel=0.01)
 
+    def test_repeat_call_tracks_current_rcparams(self):
+        """Test that cached overrides still scale the current unset font sizes."""
+        style = 'seaborn-v0_8-whitegrid'  # Sets no font sizes of its own
+        plt.rcParams['font.size'] = 10
+        assert get_oxford_rcparams(style_base=style, font_scale=2.0)['font.size'] == 20
+
+        plt.rcParams['font.size'] = 12
+        assert get_oxford_rcparams(style_base=style, font_scale=2.0)['font.size'] == 24
+
+    def test_repeat_call_returns_independent_cyclers(self):
+        """Test that modifying a returned prop_cycle does not affect later calls."""
+        cyc = get_oxford_rcparams(font_scale=1.2)['axes.prop_cycle']
+        cyc *= cycler(linestyle=['-', '--'])
+
+        assert get_oxford_rcparams(font_scale=1.2)['axes.prop_cycle'].keys == {'color'}
+
+    def test_repeat_call_returns_independent_dicts(self):
+        """Test that each call returns a new dict."""
+        params1 = get_oxford_rcparams()
+        params1['font.size'] = 99
+
+        assert get_oxford_rcparams()['font.size'] != 99
+
     def test_with_custom_color_cycle(self):
         """Test getting params with custom color cycle."""
         custom_colors = ['#FF0000', '#00FF00']
         params = get_oxford_rcparams(color_cycle=custom_colors)
 
         prop_cycle = params['axes.prop_cycle']
-        colors = [c['color'] for c in prop_cycle]
+        colors = prop_cycle.by_key()['color']
         assert colors == custom_colors
 
+    @pytest.mark.parametrize('font_scale', [1.0, 1.3])
+    @pytest.mark.parametrize('style_base', ['default', *sorted(plt.style.library)])
+    def test_matches_applied_theme(self, style_base, font_scale):
+        """Test that the returned params equal rcParams after applying the theme."""
+        params = get_oxford_rcparams(style_base=style_base, font_scale=font_scale)
+
+        apply_oxford_theme(style_base=style_base, font_scale=font_scale)
+        applied = dict(plt.rcParams)
+
+        assert params.keys() == applied.keys()
+        for key, value in applied.items():
+            assert str(params[key]) == str(value), key
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])